@@ -23,6 +23,7 @@ WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 MIN_WINDOW_WIDTH = 600
 MIN_WINDOW_HEIGHT = 400
+HISTORY_PAGE_SIZE = 200  # History rows fetched per page
 
 # Create data directory if it doesn't exist
 DATA_DIR.mkdir(exist_ok=True)
@@ -3,22 +3,59 @@ Database operations for AWS Log Checker Helper Application
 """
 
 import sqlite3
+import threading
 import datetime
 import csv
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional
 from config import DATABASE_PATH
 
+# Notes column for list views: the first 50 characters, with an ellipsis when cut
+_NOTES_PREVIEW_SQL = (
+    "CASE WHEN LENGTH(notes) > 50 THEN SUBSTR(notes, 1, 50) || '…' "
+    "ELSE COALESCE(notes, '') END"
+)
+
+# IDs per DELETE ... IN (...) statement in delete_check_records
+_DELETE_CHUNK = 500
+
 
 class DatabaseManager:
     """Manages SQLite database operations for check records"""
     
-    def __init__(self):
-        self.db_path = DATABASE_PATH
+    # get_all_checks() result, dropped whenever a record is added, changed or removed
+    _checks_cache: Optional[List[tuple]] = None
+    _checks_rev = 0
+    
+    def __init__(self, db_path=None):
+        # db_path overrides the configured file, e.g. ":memory:" for tests
+        self.db_path = DATABASE_PATH if db_path is None else db_path
+        # Guards _checks_cache and _checks_rev, which every server thread shares
+        self._checks_lock = threading.Lock()
+        # Each thread opens and keeps its own connection (_connect)
+        self._local = threading.local()
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening one tuned for small, frequent commits"""
+        # Keep the connection open so its prepared statement cache is reused across calls
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            # WAL only needs a sync at checkpoints, not on every commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            # Larger page cache (about 20 MB) so long history scans stay in memory
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA mmap_size=67108864")
+            local.conn = conn
+        return conn
+    
     def init_database(self):
         """Initialize database and create tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # WAL mode is stored in the database file, so setting it once is enough
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS check_records (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -28,6 +65,11 @@ class DatabaseManager:
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            # Serves the cutoff deletes and the newest-first history pages
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_check_records_timestamp
+                ON check_records(timestamp)
+            """)
             conn.commit()
     
     def add_check_record(self, outcome: str, notes: str = "", timestamp: Optional[datetime.datetime] = None) -> int:
@@ -35,19 +77,21 @@ class DatabaseManager:
         if timestamp is None:
             timestamp = datetime.datetime.now()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 INSERT INTO check_records (timestamp, outcome, notes)
                 VALUES (?, ?, ?)
             """, (timestamp, outcome, notes))
             conn.commit()
+            self._invalidate_checks_cache()
             return cursor.lastrowid
     
     def get_check_records(self, limit: int = 100, offset: int = 0) -> List[Dict]:
         """Retrieve check records from the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row  # Enable dict-like access
-            cursor = conn.execute("""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row  # Enable dict-like access
+            cursor.execute("""
                 SELECT id, timestamp, outcome, notes, created_at
                 FROM check_records
                 ORDER BY timestamp DESC
@@ -57,9 +101,10 @@ class DatabaseManager:
     
     def get_check_record_by_id(self, record_id: int) -> Optional[Dict]:
         """Get a specific check record by ID"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute("""
                 SELECT id, timestamp, outcome, notes, created_at
                 FROM check_records
                 WHERE id = ?
@@ -73,35 +118,60 @@ class DatabaseManager:
         if timestamp is None:
             timestamp = datetime.datetime.now()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 UPDATE check_records
                 SET timestamp = ?, outcome = ?, notes = ?
                 WHERE id = ?
             """, (timestamp, outcome, notes, record_id))
             conn.commit()
+            self._invalidate_checks_cache()
             return cursor.rowcount > 0
     
     def delete_check_record(self, record_id: int) -> bool:
         """Delete a check record"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("DELETE FROM check_records WHERE id = ?", (record_id,))
             conn.commit()
+            self._invalidate_checks_cache()
             return cursor.rowcount > 0
     
+    def delete_check_records(self, record_ids: Iterable[int]) -> int:
+        """Delete several check records in one transaction"""
+        record_ids = list(record_ids)
+        if not record_ids:
+            return 0
+        deleted = 0
+        with self._connect() as conn:
+            # Stay under SQLite's 999 bound-variable limit on older builds
+            for start in range(0, len(record_ids), _DELETE_CHUNK):
+                chunk = record_ids[start:start + _DELETE_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(f"DELETE FROM check_records WHERE id IN ({placeholders})", chunk)
+                deleted += cursor.rowcount
+            conn.commit()
+            self._invalidate_checks_cache()
+            return deleted
+    
     def get_records_count(self) -> int:
         """Get total number of check records"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM check_records")
             return cursor.fetchone()[0]
     
+    def get_checks_signature(self) -> tuple:
+        """Get (record count, highest ID), which changes when any process adds or deletes records"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM check_records").fetchone()
+    
     def get_recent_records(self, days: int = 7) -> List[Dict]:
         """Get check records from the last N days"""
         cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute("""
                 SELECT id, timestamp, outcome, notes, created_at
                 FROM check_records
                 WHERE timestamp >= ?
@@ -112,30 +182,29 @@ class DatabaseManager:
     def export_to_csv(self, filepath: str, limit: int = None) -> bool:
         """Export check records to CSV file"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 if limit:
-                    cursor = conn.execute("""
+                    cursor.execute("""
                         SELECT id, timestamp, outcome, notes, created_at
                         FROM check_records
                         ORDER BY timestamp DESC
                         LIMIT ?
                     """, (limit,))
                 else:
-                    cursor = conn.execute("""
+                    cursor.execute("""
                         SELECT id, timestamp, outcome, notes, created_at
                         FROM check_records
                         ORDER BY timestamp DESC
                     """)
                 
-                records = cursor.fetchall()
-                
                 with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
                     fieldnames = ['ID', 'Timestamp', 'Outcome', 'Notes', 'Created At']
                     writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                     
                     writer.writeheader()
-                    for record in records:
+                    for record in cursor:
                         writer.writerow({
                             'ID': record['id'],
                             'Timestamp': record['timestamp'],
@@ -153,12 +222,91 @@ class DatabaseManager:
         """Add a new check record (alias for GUI compatibility)"""
         return self.add_check_record(outcome, notes, timestamp)
     
-    def get_all_checks(self) -> List[tuple]:
+    def add_checks_bulk(self, rows: Iterable[tuple]) -> int:
+        """Add many (timestamp, outcome, notes) records in a single transaction"""
+        with self._connect() as conn:
+            cursor = conn.executemany("""
+                INSERT INTO check_records (timestamp, outcome, notes)
+                VALUES (?, ?, ?)
+            """, rows)
+            conn.commit()
+            self._invalidate_checks_cache()
+            return cursor.rowcount
+    
+    def get_all_checks(self, use_cache: bool = True) -> List[tuple]:
         """Get all check records in tuple format for GUI compatibility"""
-        records = self.get_check_records(limit=1000)  # Get more records
-        # Convert to tuple format expected by GUI: (id, timestamp, outcome, notes)
-        return [(record['id'], record['timestamp'], record['outcome'], record['notes']) 
-                for record in records]
+        with self._checks_lock:
+            if use_cache and self._checks_cache is not None:
+                return list(self._checks_cache)
+            rev = self._checks_rev
+        
+        # Select the tuple format expected by GUI, (id, timestamp, outcome, notes),
+        # directly rather than building dicts and converting them back
+        with self._connect() as conn:
+            checks = conn.execute("""
+                SELECT id, timestamp, outcome, notes
+                FROM check_records
+                ORDER BY timestamp DESC
+                LIMIT 1000
+            """).fetchall()
+        # Don't cache a result that a concurrent write has already made stale
+        with self._checks_lock:
+            if rev == self._checks_rev:
+                self._checks_cache = checks
+        return list(checks)
+    
+    @property
+    def checks_revision(self) -> int:
+        """Counter that changes whenever a record is added, changed or removed"""
+        return self._checks_rev
+    
+    def _invalidate_checks_cache(self):
+        """Forget the cached get_all_checks() result after a write"""
+        # Clear before bumping, under the lock, so no reader pairs the new
+        # revision with the old rows
+        with self._checks_lock:
+            self._checks_cache = None
+            self._checks_rev += 1
+    
+    def iter_checks_chunked(self, chunk: int = 1000) -> Iterator[List[tuple]]:
+        """Yield every check record, newest first, in GUI tuple format, chunk rows at a time"""
+        cursor = self._connect().execute("""
+            SELECT id, timestamp, outcome, notes
+            FROM check_records
+            ORDER BY timestamp DESC
+        """)
+        while True:
+            rows = cursor.fetchmany(chunk)
+            if not rows:
+                return
+            yield rows
+    
+    def get_checks_page(self, offset: int, limit: int) -> List[tuple]:
+        """Get one page of check records, newest first, in GUI tuple format with notes previews"""
+        with self._connect() as conn:
+            cursor = conn.execute(f"""
+                SELECT id, timestamp, outcome, {_NOTES_PREVIEW_SQL}
+                FROM check_records
+                ORDER BY timestamp DESC
+                LIMIT ? OFFSET ?
+            """, (limit, offset))
+            return cursor.fetchall()
+    
+    def get_checks_since(self, last_id: int) -> List[tuple]:
+        """Get check records with an ID above last_id, oldest first, with notes previews"""
+        with self._connect() as conn:
+            cursor = conn.execute(f"""
+                SELECT id, timestamp, outcome, {_NOTES_PREVIEW_SQL}
+                FROM check_records
+                WHERE id > ?
+                ORDER BY id
+            """, (last_id,))
+            return cursor.fetchall()
+    
+    def get_max_check_id(self) -> int:
+        """Get the highest check record ID, or 0 if there are none"""
+        with self._connect() as conn:
+            return conn.execute("SELECT MAX(id) FROM check_records").fetchone()[0] or 0
     
     def delete_check(self, record_id: int) -> bool:
         """Delete a check record (alias for GUI compatibility)"""
@@ -166,15 +314,30 @@ class DatabaseManager:
     
     def clean_old_records(self, cutoff_date: datetime.datetime) -> int:
         """Clean old records before cutoff date"""
-        with sqlite3.connect(self.db_path) as conn:
+        # A single DELETE runs as one transaction with one commit
+        with self._connect() as conn:
             cursor = conn.execute("""
                 DELETE FROM check_records 
                 WHERE timestamp < ?
             """, (cutoff_date,))
             conn.commit()
+            self._invalidate_checks_cache()
             return cursor.rowcount
     
+    def backup_to(self, filepath: str) -> None:
+        """Copy the database to filepath with SQLite's online backup API"""
+        dst = sqlite3.connect(filepath)
+        try:
+            # Copy in small steps so concurrent writers are not locked out for the whole copy
+            self._connect().backup(dst, pages=100)
+        finally:
+            dst.close()
+    
     def close(self):
-        """Close database connection (for compatibility)"""
-        # SQLite connections are closed automatically with context managers
-        pass
\ No newline at end of file
+        """Close the calling thread's database connection"""
+        # Connections opened by other threads are released when those threads exit
+        local = getattr(self, '_local', None)
+        conn = getattr(local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            local.conn = None
\ No newline at end of file
@@ -842,37 +842,18 @@ class EvidencePackTab(ctk.CTkFrame):
             except Exception as e:
                 print(f"Scroll error: {e}")
         
-        # Bind mousewheel events to the scrollable frame and its children
-        def bind_mousewheel_recursive(widget):
-            try:
-                widget.bind("<MouseWheel>", _on_mousewheel, add=True)  # Windows/macOS
-                widget.bind("<Button-4>", _on_mousewheel, add=True)   # Linux scroll up
-                widget.bind("<Button-5>", _on_mousewheel, add=True)   # Linux scroll down
-                
-                # Recursively bind to all children
-                for child in widget.winfo_children():
-                    try:
-                        bind_mousewheel_recursive(child)
-                    except:
-                        pass  # Skip widgets that don't support binding
-            except:
-                pass  # Skip widgets that don't support binding
-        
-        # Apply bindings with delay to ensure widgets exist
-        def apply_bindings():
-            try:
-                bind_mousewheel_recursive(self.scrollable_frame)
-                bind_mousewheel_recursive(self)
-                
-                # Also bind to the main frame
-                self.bind("<MouseWheel>", _on_mousewheel, add=True)
-                self.bind("<Button-4>", _on_mousewheel, add=True)
-                self.bind("<Button-5>", _on_mousewheel, add=True)
-            except Exception as e:
-                print(f"Binding error: {e}")
-        
-        # Apply bindings with delay to ensure widgets exist
-        self.after(50, apply_bindings)
+        # Every widget carries the "all" bindtag, so one binding covers the whole tab
+        # without walking its descendants; events outside this tab are ignored
+        def _on_mousewheel_in_tab(event):
+            widget = event.widget
+            while widget is not None:
+                if widget is self:
+                    _on_mousewheel(event)
+                    return
+                widget = getattr(widget, 'master', None)
+        
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_all(sequence, _on_mousewheel_in_tab, add=True)
     
     def refresh_content(self):
         """Refresh the content and ensure proper scrolling"""
@@ -880,9 +861,6 @@ class EvidencePackTab(ctk.CTkFrame):
             # Force update of the scrollable frame
             self.scrollable_frame.update_idletasks()
             
-            # Re-apply mousewheel scrolling to any new widgets
-            self.after(10, self.setup_mousewheel_scrolling)
-            
             # Force geometry update
             self.update_idletasks()
             
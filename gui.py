@@ -4,33 +4,161 @@ GUI components for AWS Log Checker Helper Application
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from tkinter import _stringify as _tcl_quote
 import datetime
+import logging
+import concurrent.futures
+import re
+import weakref
+from types import MappingProxyType
 from typing import Optional
 from database import DatabaseManager
 from reminder import ReminderManager
 from config import (
     APP_NAME, WINDOW_WIDTH, WINDOW_HEIGHT, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT,
-    CHECK_OUTCOMES
+    CHECK_OUTCOMES, HISTORY_PAGE_SIZE
 )
 import tkinter.font as tkfont
 
-# Import for Evidence Pack Generator
-try:
-    import customtkinter as ctk
-    from evidence_pack_tab import EvidencePackTab
-    EVIDENCE_PACK_AVAILABLE = True
-    print("Successfully imported customtkinter and evidence_pack_tab")
-except ImportError as e:
-    EVIDENCE_PACK_AVAILABLE = False
-    print(f"Warning: Evidence Pack Generator not available: {e}")
-except Exception as e:
-    EVIDENCE_PACK_AVAILABLE = False
-    print(f"Error loading Evidence Pack Generator: {e}")
+log = logging.getLogger(__name__)
+
+# Modern color scheme, read-only so every widget sees the same palette
+MODERN_COLORS = MappingProxyType({
+    'bg': '#23272e',
+    'card_bg': '#2d2d2d',
+    'input_bg': '#3c4043',
+    'accent': '#4f8cff',
+    'text': '#e6e6e6',
+    'text_secondary': '#b3b3b3',
+    'success': '#28a745',
+    'danger': '#dc3545',
+    'warning': '#ffc107'
+})
+
+# ttk style options for the modern theme, applied in order by setup_modern_theme
+_MODERN_STYLE_SPEC = [
+    ('.', {'background': MODERN_COLORS['card_bg'], 'foreground': MODERN_COLORS['text'],
+           'font': ('Segoe UI', 11)}),
+    # TLabel and TLabelframe.Label take their colours from '.'; only real differences follow
+    ('TFrame', {'relief': 'flat', 'borderwidth': 0}),
+    ('TLabelframe', {'relief': 'flat', 'borderwidth': 1}),
+    ('TButton', {'background': MODERN_COLORS['accent'], 'foreground': MODERN_COLORS['text'],
+                 'relief': 'flat', 'borderwidth': 0, 'padding': [12, 8]}),
+    ('TNotebook', {'background': MODERN_COLORS['bg'], 'borderwidth': 0, 'tabmargins': [0, 5, 0, 0]}),
+    ('TNotebook.Tab', {'background': MODERN_COLORS['card_bg'], 'foreground': MODERN_COLORS['text'],
+                       'padding': [20, 12], 'borderwidth': 0}),
+    ('TEntry', {'background': MODERN_COLORS['input_bg'], 'foreground': MODERN_COLORS['text'],
+                'insertcolor': MODERN_COLORS['text'], 'fieldbackground': MODERN_COLORS['input_bg'],
+                'borderwidth': 1, 'relief': 'flat'}),
+    ('TCombobox', {'background': MODERN_COLORS['input_bg'], 'foreground': MODERN_COLORS['text'],
+                   'selectbackground': MODERN_COLORS['accent'], 'selectforeground': MODERN_COLORS['text'],
+                   'fieldbackground': MODERN_COLORS['input_bg'], 'borderwidth': 1, 'relief': 'flat'}),
+    ('TSpinbox', {'background': MODERN_COLORS['input_bg'], 'foreground': MODERN_COLORS['text'],
+                  'insertcolor': MODERN_COLORS['text'], 'fieldbackground': MODERN_COLORS['input_bg'],
+                  'borderwidth': 1, 'relief': 'flat'}),
+    ('Treeview', {'background': MODERN_COLORS['input_bg'], 'foreground': MODERN_COLORS['text'],
+                  'fieldbackground': MODERN_COLORS['input_bg'], 'borderwidth': 0}),
+    ('Treeview.Heading', {'background': MODERN_COLORS['card_bg'], 'foreground': MODERN_COLORS['text'],
+                          'borderwidth': 0, 'relief': 'flat'}),
+]
+
+# ttk style mappings for hover effects
+_MODERN_STYLE_MAPS = [
+    ('TButton', {'background': [('active', '#3465a4'), ('pressed', '#2851a3')]}),
+    ('TNotebook.Tab', {'background': [('selected', MODERN_COLORS['accent']), ('active', '#3465a4')]}),
+    ('TEntry', {'fieldbackground': [('readonly', MODERN_COLORS['input_bg']),
+                                    ('focus', MODERN_COLORS['input_bg'])]}),
+    ('TCombobox', {'fieldbackground': [('readonly', MODERN_COLORS['input_bg']),
+                                       ('focus', MODERN_COLORS['input_bg'])]}),
+]
+
+def _tcl_command(*words):
+    """Join words into one Tcl command line, quoting each as Tkinter would"""
+    return " ".join(map(_tcl_quote, words))
+
+# The mappings need no fonts or root, so their Tcl source is built once at import
+_MODERN_STYLE_MAP_SCRIPT = "\n".join(
+    _tcl_command('ttk::style', 'map', name, *ttk._format_mapdict(options))
+    for name, options in _MODERN_STYLE_MAPS
+)
+
+# Named fonts per Tk root; fonts live in the interpreter that created them
+_FONT_CACHE = weakref.WeakKeyDictionary()
+
+def _font(widget, family, size, weight="normal"):
+    """Return a shared named Font so Tk does not re-parse font tuples per widget"""
+    root = widget._root()
+    fonts = _FONT_CACHE.get(root)
+    if fonts is None:
+        fonts = _FONT_CACHE[root] = {}
+    key = (family, size, weight)
+    font = fonts.get(key)
+    if font is None:
+        font = fonts[key] = tkfont.Font(root=root, family=family, size=size, weight=weight)
+    return font
+
+
+# Query library shown on the AWS Queries tab: (title, query, height in lines)
+_CLOUDWATCH_QUERIES = [
+    (title, query, query.count('\n') + 1) for title, query in (
+        ("🔴 Error Detection",
+         "fields @timestamp, @message\n"
+         "| filter @message like /(?i)(error|exception|fail|failed)/\n"
+         "| sort @timestamp desc\n"
+         "| limit 10"),
+        ("⚡ Performance Issues",
+         "fields @timestamp, @message, elapsed_ms\n"
+         "| filter ispresent(elapsed_ms)\n"
+         "| sort elapsed_ms desc\n"
+         "| limit 10"),
+        ("💾 Memory Usage",
+         "fields @timestamp, @message\n"
+         "| filter @message like /memory/\n"
+         "| sort @timestamp desc\n"
+         "| limit 10"),
+    )
+]
+
+_AWS_CLI_QUERIES = [
+    (title, query, query.count('\n') + 1) for title, query in (
+        ("🔐 CloudTrail Failed Logins",
+         "aws logs start-query \\\n"
+         "--log-group-name YOUR_CLOUDTRAIL_LOG_GROUP \\\n"
+         "--start-time $(date -v-2H +%s) \\\n"
+         "--end-time $(date +%s) \\\n"
+         '--query-string "fields @timestamp, @message | filter eventName = \'ConsoleLogin\' and errorMessage = \'Failed authentication\'"'),
+        ("🖥️ SSM Session History",
+         "aws ssm describe-sessions \\\n"
+         '--state "History" \\\n'
+         "--filters key=Owner,value=* \\\n"
+         '--query "Sessions[?StartDate>=`date -v-2H +%Y-%m-%dT%H:%M:%SZ`].[SessionId,Owner,StartDate]" \\\n'
+         "--output table"),
+    )
+]
+
+# Sections of the AWS Queries tab, in display order
+_QUERY_SECTIONS = (
+    ("CloudWatch Insights Queries", _CLOUDWATCH_QUERIES),
+    ("AWS CLI Commands", _AWS_CLI_QUERIES),
+)
+
+# History table columns and their widths in pixels
+_HISTORY_COLUMNS = ("ID", "Date/Time", "Outcome", "Notes")
+_HISTORY_COLUMN_WIDTHS = (60, 180, 150, 300)
+
+# Theme already applied to each Tk root (styles are per interpreter)
+_STYLE_CACHE = weakref.WeakKeyDictionary()
+
+# Expected shape of the Date & Time field (YYYY-MM-DD HH:MM:SS)
+_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+
+# Resting text of the query copy buttons
+_COPY_LABEL = "📋 Copy"
 
 
 class ModernFrame(tk.Frame):
     """Custom frame with modern styling"""
-    def __init__(self, parent, bg_color="#2d2d2d", corner_radius=10, **kwargs):
+    def __init__(self, parent, bg_color=MODERN_COLORS['card_bg'], corner_radius=10, **kwargs):
         super().__init__(parent, bg=bg_color, relief="flat", bd=0, **kwargs)
         self.bg_color = bg_color
         self.corner_radius = corner_radius
@@ -38,67 +166,87 @@ class ModernFrame(tk.Frame):
 
 class ModernButton(tk.Button):
     """Custom button with modern styling"""
+    _BASE = MappingProxyType({
+        'bg': MODERN_COLORS['accent'],
+        'fg': '#ffffff',
+        'relief': 'flat',
+        'bd': 0,
+        'cursor': 'hand2',
+        'activebackground': '#3465a4',
+        'activeforeground': '#ffffff'
+    })
+
     def __init__(self, parent, **kwargs):
-        # Set default modern styling
-        style_kwargs = {
-            'bg': '#4f8cff',
-            'fg': '#ffffff',
-            'relief': 'flat',
-            'bd': 0,
-            'font': ('Segoe UI', 11),
-            'cursor': 'hand2',
-            'activebackground': '#3465a4',
-            'activeforeground': '#ffffff'
-        }
-        style_kwargs.update(kwargs)
-        super().__init__(parent, **style_kwargs)
+        # Fonts need a live root, so they are resolved here rather than in _BASE
+        super().__init__(parent, **{'font': _font(parent, 'Segoe UI', 11), **self._BASE, **kwargs})
 
 
 class ModernEntry(tk.Entry):
     """Custom entry with modern styling"""
+    _BASE = MappingProxyType({
+        'bg': MODERN_COLORS['input_bg'],
+        'fg': MODERN_COLORS['text'],
+        'relief': 'flat',
+        'bd': 1,
+        'insertbackground': MODERN_COLORS['text'],
+        'highlightthickness': 1,
+        'highlightcolor': MODERN_COLORS['accent'],
+        'highlightbackground': MODERN_COLORS['card_bg']
+    })
+
     def __init__(self, parent, **kwargs):
-        style_kwargs = {
-            'bg': '#3c4043',
-            'fg': '#e6e6e6',
-            'relief': 'flat',
-            'bd': 1,
-            'font': ('Segoe UI', 11),
-            'insertbackground': '#e6e6e6',
-            'highlightthickness': 1,
-            'highlightcolor': '#4f8cff',
-            'highlightbackground': '#2d2d2d'
-        }
-        style_kwargs.update(kwargs)
-        super().__init__(parent, **style_kwargs)
+        super().__init__(parent, **{'font': _font(parent, 'Segoe UI', 11), **self._BASE, **kwargs})
 
 
 class ModernLabel(tk.Label):
     """Custom label with modern styling"""
+    _BASE = MappingProxyType({
+        'bg': MODERN_COLORS['card_bg'],
+        'fg': MODERN_COLORS['text']
+    })
+
     def __init__(self, parent, **kwargs):
-        style_kwargs = {
-            'bg': '#2d2d2d',
-            'fg': '#e6e6e6',
-            'font': ('Segoe UI', 11)
-        }
-        style_kwargs.update(kwargs)
-        super().__init__(parent, **style_kwargs)
+        super().__init__(parent, **{'font': _font(parent, 'Segoe UI', 11), **self._BASE, **kwargs})
 
 
 class ModernText(scrolledtext.ScrolledText):
     """Custom text widget with modern styling"""
+    _BASE = MappingProxyType({
+        'bg': MODERN_COLORS['input_bg'],
+        'fg': MODERN_COLORS['text'],
+        'relief': 'flat',
+        'bd': 1,
+        'insertbackground': MODERN_COLORS['text'],
+        'selectbackground': MODERN_COLORS['accent'],
+        'selectforeground': '#ffffff'
+    })
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **{'font': _font(parent, 'Segoe UI', 11), **self._BASE, **kwargs})
+
+
+class CachedScrollCanvas(tk.Canvas):
+    """Canvas that caches bbox("all") until its scrolled content changes size"""
     def __init__(self, parent, **kwargs):
-        style_kwargs = {
-            'bg': '#3c4043',
-            'fg': '#e6e6e6',
-            'relief': 'flat',
-            'bd': 1,
-            'font': ('Segoe UI', 11),
-            'insertbackground': '#e6e6e6',
-            'selectbackground': '#4f8cff',
-            'selectforeground': '#ffffff'
-        }
-        style_kwargs.update(kwargs)
-        super().__init__(parent, **style_kwargs)
+        super().__init__(parent, **kwargs)
+        self._bbox_cache = None
+    
+    def mark_dirty(self):
+        """Forget the cached bounding box"""
+        self._bbox_cache = None
+    
+    def refresh_scrollregion(self, dirty=False):
+        """Set the scrollregion, walking the canvas items only when dirty"""
+        if dirty:
+            self.mark_dirty()
+        if self._bbox_cache is None:
+            self._bbox_cache = self.bbox("all")
+        self.configure(scrollregion=self._bbox_cache)
+    
+    def set_content_size(self, width, height):
+        """Set the scrollregion from the size of a window item anchored at (0, 0)"""
+        self._bbox_cache = (0, 0, width, height)
+        self.configure(scrollregion=self._bbox_cache)
 
 
 class MainWindow:
@@ -107,93 +255,75 @@ class MainWindow:
     def __init__(self):
         self.root = tk.Tk()
         self.db = DatabaseManager()
+        # Single worker so database calls stay ordered and off the Tk thread
+        self._db_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.reminder_manager = ReminderManager(self.root)
+        self.reminder_manager.set_reminder_callback(self.on_reminder_triggered)
         self.dark_mode = True  # Start with dark mode
+        self._refresh_after_id = None  # Pending debounced tab refresh
+        self._interval_after_id = None  # Pending debounced reminder interval change
+        self._applied_interval = None  # Interval text the reminders were last scheduled with
+        self._details_window = None  # Check details popup, built on first use
+        self._toast_after_id = None  # Pending clear of the status line
+        self._copy_after_ids = {}  # Pending copy-button label resets, by widget path
+        self._current_dt = ("", None)  # Text and datetime last filled in by set_current_datetime
+        self._last_max_id = None  # Highest record ID shown in the history tab
+        self._history_offset = 0  # Records covered by the history pages loaded so far
+        self._history_exhausted = False  # Set once a short page shows there are no more
+        self._history_loading = True  # A history page is in flight; the first is pending
+        self._history_refresh = None  # Future of the last incremental history refresh
+        self._history_refresh_again = False  # A refresh was requested while one was in flight
+        self._selected_ids = ()  # History item IDs selected, kept current by <<TreeviewSelect>>
         self.setup_modern_theme()  # Use modern theme
         self.setup_window()
         self.create_widgets()
         self.setup_reminder_system()
-        self.refresh_history()
+        self.root.after_idle(self.refresh_history)  # Load history after the first paint
     
     def setup_modern_theme(self):
         """Set modern dark theme with rounded corners and custom styling"""
         # Modern color scheme
-        self.colors = {
-            'bg': '#23272e',
-            'card_bg': '#2d2d2d',
-            'input_bg': '#3c4043',
-            'accent': '#4f8cff',
-            'text': '#e6e6e6',
-            'text_secondary': '#b3b3b3',
-            'success': '#28a745',
-            'danger': '#dc3545',
-            'warning': '#ffc107'
-        }
+        self.colors = MODERN_COLORS
         
         # Configure root window
         self.root.configure(bg=self.colors['bg'])
         
+        # ttk styles live in the Tk interpreter, so only apply them once per root
+        if _STYLE_CACHE.get(self.root) == 'modern_dark':
+            return
+        
         # Configure ttk styles for modern look
-        style = ttk.Style(self.root)
-        style.theme_use('clam')
-        
-        # Configure ttk styles to match modern theme
-        style.configure('.', background=self.colors['card_bg'], foreground=self.colors['text'], 
-                       font=('Segoe UI', 11))
-        style.configure('TLabel', background=self.colors['card_bg'], foreground=self.colors['text'])
-        style.configure('TFrame', background=self.colors['card_bg'], relief='flat', borderwidth=0)
-        style.configure('TLabelframe', background=self.colors['card_bg'], foreground=self.colors['text'],
-                       relief='flat', borderwidth=1)
-        style.configure('TLabelframe.Label', background=self.colors['card_bg'], 
-                       foreground=self.colors['text'])
-        style.configure('TButton', background=self.colors['accent'], foreground=self.colors['text'],
-                       relief='flat', borderwidth=0, padding=[12, 8])
-        style.configure('TNotebook', background=self.colors['bg'], borderwidth=0, tabmargins=[0, 5, 0, 0])
-        style.configure('TNotebook.Tab', background=self.colors['card_bg'], foreground=self.colors['text'], 
-                       padding=[20, 12], borderwidth=0)
-        style.configure('TEntry', background=self.colors['input_bg'], foreground=self.colors['text'], 
-                       insertcolor=self.colors['text'], fieldbackground=self.colors['input_bg'], 
-                       borderwidth=1, relief='flat')
-        style.configure('TCombobox', background=self.colors['input_bg'], foreground=self.colors['text'], 
-                       selectbackground=self.colors['accent'], selectforeground=self.colors['text'], 
-                       fieldbackground=self.colors['input_bg'], borderwidth=1, relief='flat')
-        style.configure('TSpinbox', background=self.colors['input_bg'], foreground=self.colors['text'], 
-                       insertcolor=self.colors['text'], fieldbackground=self.colors['input_bg'], 
-                       borderwidth=1, relief='flat')
-        style.configure('Treeview', background=self.colors['input_bg'], foreground=self.colors['text'], 
-                       fieldbackground=self.colors['input_bg'], borderwidth=0)
-        style.configure('Treeview.Heading', background=self.colors['card_bg'], 
-                       foreground=self.colors['text'], borderwidth=0, relief='flat')
-        
-        # Configure style mappings for hover effects
-        style.map('TButton', 
-                 background=[('active', '#3465a4'), ('pressed', '#2851a3')])
-        style.map('TNotebook.Tab', 
-                 background=[('selected', self.colors['accent']), ('active', '#3465a4')])
-        style.map('TEntry', 
-                 fieldbackground=[('readonly', self.colors['input_bg']), ('focus', self.colors['input_bg'])])
-        style.map('TCombobox', 
-                 fieldbackground=[('readonly', self.colors['input_bg']), ('focus', self.colors['input_bg'])])
+        ttk.Style(self.root).theme_use('clam')
+        
+        # Apply every configure and map as one Tcl script instead of a call per style
+        commands = []
+        for name, options in _MODERN_STYLE_SPEC:
+            if 'font' in options:
+                options = {**options, 'font': _font(self.root, *options['font'])}
+            commands.append(_tcl_command('ttk::style', 'configure', name, *ttk._format_optdict(options)))
+        commands.append(_MODERN_STYLE_MAP_SCRIPT)
+        self.root.tk.eval("\n".join(commands))
         
         # Set default font
         default_font = tkfont.nametofont("TkDefaultFont")
         default_font.configure(family="Segoe UI", size=11)
         self.root.option_add("*Font", default_font)
+        
+        _STYLE_CACHE[self.root] = 'modern_dark'
     
     def create_modern_section(self, parent, title, content_height=None):
         """Create a modern section with title and content area"""
         # Section container
-        section_frame = ModernFrame(parent, bg_color=self.colors['card_bg'])
+        section_frame = ModernFrame(parent)
         section_frame.pack(fill=tk.X, padx=20, pady=15)
         
         # Title
         title_label = ModernLabel(section_frame, text=title, 
-                                 font=('Segoe UI', 16, 'bold'),
-                                 bg=self.colors['card_bg'])
+                                 font=_font(self.root, 'Segoe UI', 16, 'bold'))
         title_label.pack(pady=(20, 15), padx=20, anchor="w")
         
         # Content frame
-        content_frame = ModernFrame(section_frame, bg_color=self.colors['card_bg'])
+        content_frame = ModernFrame(section_frame)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
         
         return section_frame, content_frame
@@ -215,10 +345,16 @@ class MainWindow:
         
         # App title
         app_title = ModernLabel(main_container, text="AWS Log Checker Helper", 
-                               font=('Segoe UI', 24, 'bold'),
+                               font=_font(self.root, 'Segoe UI', 24, 'bold'),
                                bg=self.colors['bg'])
         app_title.pack(pady=(20, 10))
         
+        # Status line for non-blocking confirmations; packed before the notebook
+        # so it keeps its row when the window is small
+        self.status_label = ModernLabel(main_container, text="", anchor="w",
+                                        bg=self.colors['bg'], fg=self.colors['text_secondary'])
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=(0, 10))
+        
         # Create notebook for tabs
         self.notebook = ttk.Notebook(main_container)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
@@ -226,113 +362,138 @@ class MainWindow:
         # Bind tab change event
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
+        # One app-wide mousewheel binding scrolls the visible tab's canvas
+        self._scrollables = {}
+        # Per-tab refresh actions, registered as each tab is built
+        self._tab_handlers = {}
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_all(sequence, self._on_mousewheel)
+        
+        # Reminder settings are needed before the Settings tab is first shown
+        self.reminder_enabled_var = tk.BooleanVar(value=True)
+        self.reminder_interval_var = tk.StringVar(value="24")
+        
         # Create tabs
         self.create_entry_tab(self.notebook)
         self.create_history_tab(self.notebook)
-        self.create_queries_tab(self.notebook)
-        self.create_evidence_tab(self.notebook)
-        self.create_settings_tab(self.notebook)
+        
+        # The remaining tabs are empty placeholders until first selected
+        self._tab_builders = {}
+        self.queries_frame = self._add_lazy_tab("🔍 AWS Queries", self.create_queries_tab)
+        self.evidence_frame = self._add_lazy_tab("📋 Evidence Pack", self.create_evidence_tab)
+        self.settings_frame = self._add_lazy_tab("⚙️ Settings", self.create_settings_tab)
+    
+    def _add_lazy_tab(self, text, builder):
+        """Add a placeholder tab whose content is built by builder() on first view"""
+        frame = ModernFrame(self.notebook, bg_color=self.colors['bg'])
+        self.notebook.add(frame, text=text)
+        self._tab_builders[str(frame)] = builder
+        return frame
     
     def on_tab_changed(self, event):
         """Handle tab change events to ensure proper content loading"""
-        selected_tab = event.widget.select()
-        tab_text = event.widget.tab(selected_tab, "text")
+        # Build the tab's widgets the first time it is selected
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder:
+            builder()
+        
+        # Coalesce rapid tab switches into a single refresh
+        if self._refresh_after_id:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(50, self.refresh_current_tab_content)
+    
+    def _on_mousewheel(self, event):
+        """Scroll the canvas of the scrollable tab under the pointer"""
+        # Walk up from the widget under the pointer to its tab frame
+        widget = event.widget
+        canvas = None
+        while canvas is None and widget is not None:
+            canvas = self._scrollables.get(str(widget))
+            widget = getattr(widget, 'master', None)
+        if canvas is None:
+            return
         
-        # Force canvas updates based on which tab is selected
-        self.root.after(1, self.refresh_current_tab_content)
+        if event.delta:
+            # Windows/macOS with delta
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        elif event.num == 4:
+            # Linux scroll events
+            canvas.yview_scroll(-1, "units")
+        elif event.num == 5:
+            canvas.yview_scroll(1, "units")
     
     def refresh_current_tab_content(self):
         """Refresh the content of the currently selected tab"""
+        self._refresh_after_id = None
         try:
-            current_tab = self.notebook.select()
-            tab_text = self.notebook.tab(current_tab, "text")
-            
-            # Update scrollregion for each tab's canvas
-            if "📝 Log Check" in tab_text and hasattr(self, 'entry_canvas'):
-                self.entry_canvas.configure(scrollregion=self.entry_canvas.bbox("all"))
-                self.entry_canvas.update_idletasks()
-            elif "🔍 AWS Queries" in tab_text and hasattr(self, 'queries_canvas'):
-                self.queries_canvas.configure(scrollregion=self.queries_canvas.bbox("all"))
-                self.queries_canvas.update_idletasks()
-            elif "⚙️ Settings" in tab_text and hasattr(self, 'settings_canvas'):
-                self.settings_canvas.configure(scrollregion=self.settings_canvas.bbox("all"))
-                self.settings_canvas.update_idletasks()
-            elif "📊 History" in tab_text:
-                # Refresh history data when tab is selected
-                self.refresh_history()
-            elif "📋 Evidence Pack" in tab_text and hasattr(self, 'evidence_pack_generator'):
-                # Force immediate refresh and update of the Evidence Pack tab
-                self.evidence_pack_generator.force_update()
+            handler = self._tab_handlers.get(self.notebook.select())
+            if handler:
+                handler()
         except Exception as e:
             print(f"Error refreshing tab content: {e}")
     
-    def create_entry_tab(self, parent):
-        """Create the log entry tab with modern styling"""
-        self.entry_frame = ModernFrame(parent, bg_color=self.colors['bg'])
-        parent.add(self.entry_frame, text="📝 Log Check")
-        
-        # Create scrollable content
-        canvas = tk.Canvas(self.entry_frame, bg=self.colors['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.entry_frame, orient="vertical", command=canvas.yview)
+    def _make_scrollable_tab(self, tab_frame):
+        """Fill a tab with a scrollable canvas and return (inner frame, canvas)"""
+        canvas = CachedScrollCanvas(tab_frame, bg=self.colors['bg'], highlightthickness=0)
+        scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ModernFrame(canvas, bg_color=self.colors['bg'])
         
+        # The inner frame is the only item, so its new size is the scrollregion
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.set_content_size(e.width, e.height)
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Enhanced mousewheel scrolling for macOS
-        def _on_mousewheel(event):
-            if hasattr(event, 'delta') and event.delta:
-                # Windows/macOS with delta
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            elif hasattr(event, 'num'):
-                # Linux scroll events
-                if event.num == 4:
-                    canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    canvas.yview_scroll(1, "units")
-        
-        # Bind mousewheel to the entire tab area
-        def bind_mousewheel_to_all(widget):
-            try:
-                widget.bind("<MouseWheel>", _on_mousewheel, add=True)
-                widget.bind("<Button-4>", _on_mousewheel, add=True)
-                widget.bind("<Button-5>", _on_mousewheel, add=True)
-                for child in widget.winfo_children():
-                    bind_mousewheel_to_all(child)
-            except:
-                pass
-        
-        # Apply comprehensive mousewheel binding
-        def setup_mousewheel():
-            bind_mousewheel_to_all(self.entry_frame)
-            bind_mousewheel_to_all(canvas)
-            bind_mousewheel_to_all(scrollable_frame)
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Register the canvas for mousewheel scrolling
+        self._scrollables[str(tab_frame)] = canvas
+        self._tab_handlers[str(tab_frame)] = canvas.refresh_scrollregion
+        
+        # Force initial update and ensure proper scrolling setup
+        def setup_scrolling():
+            canvas.refresh_scrollregion()
+            canvas.update_idletasks()
+        
+        self.root.after_idle(setup_scrolling)
+        
+        return scrollable_frame, canvas
+    
+    def create_entry_tab(self, parent):
+        """Create the log entry tab with modern styling"""
+        self.entry_frame = ModernFrame(parent, bg_color=self.colors['bg'])
+        parent.add(self.entry_frame, text="📝 Log Check")
+        
+        # Create scrollable content
+        scrollable_frame, self.entry_canvas = self._make_scrollable_tab(self.entry_frame)
         
         # Entry form section
         form_section, form_content = self.create_modern_section(scrollable_frame, "Check Details")
         
         # Date and time row
-        datetime_row = ModernFrame(form_content, bg_color=self.colors['card_bg'])
+        datetime_row = ModernFrame(form_content)
         datetime_row.pack(fill=tk.X, pady=10)
         
-        ModernLabel(datetime_row, text="Date & Time:", bg=self.colors['card_bg']).pack(side=tk.LEFT)
+        ModernLabel(datetime_row, text="Date & Time:").pack(side=tk.LEFT)
         self.datetime_var = tk.StringVar()
         self.datetime_entry = ModernEntry(datetime_row, textvariable=self.datetime_var, width=20)
         self.datetime_entry.pack(side=tk.LEFT, padx=(15, 10))
         
+        # Re-check the format on every change so Save follows the current text
+        self.datetime_var.trace_add('write', self.validate_datetime)
+        
         now_btn = ModernButton(datetime_row, text="Now", command=self.set_current_datetime)
         now_btn.pack(side=tk.LEFT)
         
         # Outcome row
-        outcome_row = ModernFrame(form_content, bg_color=self.colors['card_bg'])
+        outcome_row = ModernFrame(form_content)
         outcome_row.pack(fill=tk.X, pady=10)
         
-        ModernLabel(outcome_row, text="Outcome:", bg=self.colors['card_bg']).pack(side=tk.LEFT)
+        ModernLabel(outcome_row, text="Outcome:").pack(side=tk.LEFT)
         self.outcome_var = tk.StringVar()
         self.outcome_combo = ttk.Combobox(outcome_row, textvariable=self.outcome_var,
                                          values=CHECK_OUTCOMES, state="readonly", width=20)
@@ -340,18 +501,18 @@ class MainWindow:
         self.outcome_combo.set(CHECK_OUTCOMES[0])
         
         # Notes section
-        notes_label = ModernLabel(form_content, text="Notes:", bg=self.colors['card_bg'])
+        notes_label = ModernLabel(form_content, text="Notes:")
         notes_label.pack(anchor=tk.W, pady=(15, 5))
         
         self.notes_text = ModernText(form_content, height=6, wrap=tk.WORD)
         self.notes_text.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
         # Buttons row
-        button_row = ModernFrame(form_content, bg_color=self.colors['card_bg'])
+        button_row = ModernFrame(form_content)
         button_row.pack(fill=tk.X, pady=(10, 0))
         
         # Create buttons with explicit styling to override macOS defaults
-        save_btn = tk.Button(button_row, 
+        self.save_btn = tk.Button(button_row, 
                             text="💾 Save Check", 
                             command=self.save_check,
                             bg=self.colors['success'], 
@@ -360,11 +521,11 @@ class MainWindow:
                             activeforeground='#ffffff',
                             relief='flat',
                             bd=0,
-                            font=('Segoe UI', 11),
+                            font=_font(self.root, 'Segoe UI', 11),
                             cursor='hand2',
                             padx=15,
                             pady=8)
-        save_btn.pack(side=tk.LEFT, padx=(0, 15))
+        self.save_btn.pack(side=tk.LEFT, padx=(0, 15))
         
         clear_btn = tk.Button(button_row, 
                              text="🗑️ Clear Form", 
@@ -375,50 +536,40 @@ class MainWindow:
                              activeforeground='#ffffff',
                              relief='flat',
                              bd=0,
-                             font=('Segoe UI', 11),
+                             font=_font(self.root, 'Segoe UI', 11),
                              cursor='hand2',
                              padx=15,
                              pady=8)
         clear_btn.pack(side=tk.LEFT)
         
-        # Pack scrollable content
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
         # Initialize with current date/time
         self.set_current_datetime()
-        
-        # Store canvas reference for tab refresh
-        self.entry_canvas = canvas
-        
-        # Force initial update and ensure proper scrolling setup
-        def setup_scrolling():
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.update_idletasks()
-            setup_mousewheel()
-        
-        self.root.after(50, setup_scrolling)
     
     def create_history_tab(self, parent):
         """Create the history viewing tab with modern styling"""
         self.history_frame = ModernFrame(parent, bg_color=self.colors['bg'])
         parent.add(self.history_frame, text="📊 History")
+        # Refresh history data when tab is selected
+        self._tab_handlers[str(self.history_frame)] = self.refresh_history
         
         # History section
         history_section, history_content = self.create_modern_section(self.history_frame, "Check History")
         
         # Controls row
-        controls_row = ModernFrame(history_content, bg_color=self.colors['card_bg'])
+        controls_row = ModernFrame(history_content)
         controls_row.pack(fill=tk.X, pady=(0, 15))
         
         export_btn = ModernButton(controls_row, text="📤 Export CSV", command=self.export_to_csv)
         export_btn.pack(side=tk.LEFT, padx=(0, 10))
         
-        delete_btn = ModernButton(controls_row, text="🗑️ Delete Selected", 
-                                 command=self.delete_selected_record, bg=self.colors['danger'])
-        delete_btn.pack(side=tk.LEFT, padx=(0, 10))
+        # Disabled until a record is selected
+        self.delete_btn = ModernButton(controls_row, text="🗑️ Delete Selected", 
+                                      command=self.delete_selected_record, bg=self.colors['danger'],
+                                      state=tk.DISABLED)
+        self.delete_btn.pack(side=tk.LEFT, padx=(0, 10))
         
-        refresh_btn = ModernButton(controls_row, text="🔄 Refresh", command=self.refresh_history)
+        refresh_btn = ModernButton(controls_row, text="🔄 Refresh",
+                                  command=lambda: self.refresh_history(full=True))
         refresh_btn.pack(side=tk.LEFT)
         
         # History list container
@@ -426,180 +577,106 @@ class MainWindow:
         list_container.pack(fill=tk.BOTH, expand=True)
         
         # Treeview for history
-        columns = ("ID", "Date/Time", "Outcome", "Notes")
-        self.history_tree = ttk.Treeview(list_container, columns=columns, show="headings", height=15)
+        self.history_tree = ttk.Treeview(list_container, columns=_HISTORY_COLUMNS, show="headings", height=15)
         
         # Configure columns
-        self.history_tree.heading("ID", text="ID")
-        self.history_tree.heading("Date/Time", text="Date/Time")
-        self.history_tree.heading("Outcome", text="Outcome")
-        self.history_tree.heading("Notes", text="Notes")
-        
-        self.history_tree.column("ID", width=60)
-        self.history_tree.column("Date/Time", width=180)
-        self.history_tree.column("Outcome", width=150)
-        self.history_tree.column("Notes", width=300)
+        heading, column = self.history_tree.heading, self.history_tree.column
+        for name, width in zip(_HISTORY_COLUMNS, _HISTORY_COLUMN_WIDTHS):
+            heading(name, text=name)
+            column(name, width=width)
         
         # Scrollbar for treeview
-        tree_scrollbar = ttk.Scrollbar(list_container, orient=tk.VERTICAL, command=self.history_tree.yview)
-        self.history_tree.configure(yscrollcommand=tree_scrollbar.set)
+        self.history_scrollbar = ttk.Scrollbar(list_container, orient=tk.VERTICAL, command=self.history_tree.yview)
+        self.history_tree.configure(yscrollcommand=self._on_history_yscroll)
         
         # Pack treeview and scrollbar
         self.history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10, padx=(0, 10))
+        self.history_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=10, padx=(0, 10))
         
         # Bind double-click to view details
         self.history_tree.bind("<Double-1>", self.on_history_double_click)
+        self.history_tree.bind("<<TreeviewSelect>>", self._on_history_select)
     
-    def create_queries_tab(self, parent):
+    def create_queries_tab(self):
         """Create the AWS queries tab with modern styling"""
-        self.queries_frame = ModernFrame(parent, bg_color=self.colors['bg'])
-        parent.add(self.queries_frame, text="🔍 AWS Queries")
-        
-        # Create scrollable frame
-        canvas = tk.Canvas(self.queries_frame, bg=self.colors['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.queries_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ModernFrame(canvas, bg_color=self.colors['bg'])
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Enhanced mousewheel scrolling for macOS
-        def _on_mousewheel(event):
-            if hasattr(event, 'delta') and event.delta:
-                # Windows/macOS with delta
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            elif hasattr(event, 'num'):
-                # Linux scroll events
-                if event.num == 4:
-                    canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    canvas.yview_scroll(1, "units")
-        
-        # Bind mousewheel to the entire tab area
-        def bind_mousewheel_to_all(widget):
-            try:
-                widget.bind("<MouseWheel>", _on_mousewheel, add=True)
-                widget.bind("<Button-4>", _on_mousewheel, add=True)
-                widget.bind("<Button-5>", _on_mousewheel, add=True)
-                for child in widget.winfo_children():
-                    bind_mousewheel_to_all(child)
-            except:
-                pass
-        
-        # Apply comprehensive mousewheel binding
-        def setup_mousewheel():
-            bind_mousewheel_to_all(self.queries_frame)
-            bind_mousewheel_to_all(canvas)
-            bind_mousewheel_to_all(scrollable_frame)
-        
-        # CloudWatch Insights Queries
-        insights_section, insights_content = self.create_modern_section(scrollable_frame, "CloudWatch Insights Queries")
-        
-        self.add_modern_query_section(insights_content, "🔴 Error Detection", 
-            "fields @timestamp, @message\n"
-            "| filter @message like /(?i)(error|exception|fail|failed)/\n"
-            "| sort @timestamp desc\n"
-            "| limit 10")
-        
-        self.add_modern_query_section(insights_content, "⚡ Performance Issues", 
-            "fields @timestamp, @message, elapsed_ms\n"
-            "| filter ispresent(elapsed_ms)\n"
-            "| sort elapsed_ms desc\n"
-            "| limit 10")
-        
-        self.add_modern_query_section(insights_content, "💾 Memory Usage", 
-            "fields @timestamp, @message\n"
-            "| filter @message like /memory/\n"
-            "| sort @timestamp desc\n"
-            "| limit 10")
-        
-        # AWS CLI Commands
-        cli_section, cli_content = self.create_modern_section(scrollable_frame, "AWS CLI Commands")
-        
-        self.add_modern_query_section(cli_content, "🔐 CloudTrail Failed Logins",
-            "aws logs start-query \\\n"
-            "--log-group-name YOUR_CLOUDTRAIL_LOG_GROUP \\\n"
-            "--start-time $(date -v-2H +%s) \\\n"
-            "--end-time $(date +%s) \\\n"
-            '--query-string "fields @timestamp, @message | filter eventName = \'ConsoleLogin\' and errorMessage = \'Failed authentication\'"')
-        
-        self.add_modern_query_section(cli_content, "🖥️ SSM Session History",
-            "aws ssm describe-sessions \\\n"
-            '--state "History" \\\n'
-            "--filters key=Owner,value=* \\\n"
-            '--query "Sessions[?StartDate>=`date -v-2H +%Y-%m-%dT%H:%M:%SZ`].[SessionId,Owner,StartDate]" \\\n'
-            "--output table")
-        
-        # Apply mousewheel to new content
-        bind_mousewheel_to_all(insights_content)
-        bind_mousewheel_to_all(cli_content)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Store canvas reference for tab refresh
-        self.queries_canvas = canvas
-        
-        # Force initial update and ensure proper scrolling setup
-        def setup_scrolling():
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.update_idletasks()
-            setup_mousewheel()
-        
-        self.root.after(50, setup_scrolling)
+        # Create scrollable content
+        scrollable_frame, self.queries_canvas = self._make_scrollable_tab(self.queries_frame)
+        
+        # Look the theme colours up once for every section
+        colors = self.colors
+        palette = (colors['input_bg'], colors['success'], colors['card_bg'], colors['text'])
+        # Kept so a theme change can recolour the query texts without walking the widget tree
+        self._query_texts = []
+        
+        # One section per query table
+        for section_title, queries in _QUERY_SECTIONS:
+            section, content = self.create_modern_section(scrollable_frame, section_title)
+            for title, query, height in queries:
+                self.add_modern_query_section(content, title, query, height, palette)
     
-    def add_modern_query_section(self, parent, title, query):
+    def add_modern_query_section(self, parent, title, query, height, palette):
         """Add a modern query section with copy button"""
+        input_bg, button_bg, text_bg, text_fg = palette
+        
         # Query container
-        query_container = ModernFrame(parent, bg_color=self.colors['input_bg'])
+        query_container = ModernFrame(parent, bg_color=input_bg)
         query_container.pack(fill=tk.X, pady=10)
         
         # Header with title and copy button
-        header_frame = ModernFrame(query_container, bg_color=self.colors['input_bg'])
+        header_frame = ModernFrame(query_container, bg_color=input_bg)
         header_frame.pack(fill=tk.X, padx=15, pady=(15, 10))
         
-        title_label = ModernLabel(header_frame, text=title, font=('Segoe UI', 12, 'bold'),
-                                 bg=self.colors['input_bg'])
+        title_label = ModernLabel(header_frame, text=title, font=_font(self.root, 'Segoe UI', 12, 'bold'),
+                                 bg=input_bg)
         title_label.pack(side=tk.LEFT)
         
-        copy_btn = ModernButton(header_frame, text="📋 Copy", 
-                               command=lambda: self.copy_to_clipboard(query),
-                               bg=self.colors['success'])
+        copy_btn = ModernButton(header_frame, text=_COPY_LABEL,
+                               command=lambda: self.copy_to_clipboard(query, copy_btn),
+                               bg=button_bg)
         copy_btn.pack(side=tk.RIGHT)
         
         # Query text
-        query_text = tk.Text(query_container, height=len(query.split('\n')), wrap=tk.WORD,
-                           font=('Consolas', 10), state=tk.DISABLED,
-                           bg=self.colors['card_bg'], fg=self.colors['text'],
-                           relief='flat', bd=0)
+        query_text = self._install_readonly_text(query_container, query, height, text_bg, text_fg)
         query_text.pack(fill=tk.X, padx=15, pady=(0, 15))
-        
-        # Insert query text
-        query_text.config(state=tk.NORMAL)
-        query_text.insert(1.0, query)
-        query_text.config(state=tk.DISABLED)
+        self._query_texts.append(query_text)
     
-    def create_evidence_tab(self, parent):
+    def _install_readonly_text(self, parent, content, height, bg, fg):
+        """Create a read-only Text widget pre-filled with content"""
+        text = tk.Text(parent, height=height, wrap=tk.WORD,
+                       font=_font(self.root, 'Consolas', 10),
+                       bg=bg, fg=fg,
+                       relief='flat', bd=0)
+        text.insert(1.0, content)
+        text.config(state=tk.DISABLED)
+        return text
+    
+    def create_evidence_tab(self):
         """Create the evidence pack tab with modern styling"""
-        if EVIDENCE_PACK_AVAILABLE:
+        # customtkinter is a heavy import, so load it only when the tab is first shown
+        try:
+            import customtkinter as ctk
+            from evidence_pack_tab import EvidencePackTab
+            evidence_pack_available = True
+            log.debug("Successfully imported customtkinter and evidence_pack_tab")
+        except ImportError as e:
+            evidence_pack_available = False
+            log.warning("Evidence Pack Generator not available: %s", e)
+        except Exception as e:
+            evidence_pack_available = False
+            log.error("Error loading Evidence Pack Generator: %s", e)
+        
+        if evidence_pack_available:
             # Use CustomTkinter for the evidence pack tab
-            self.evidence_frame = ctk.CTkFrame(parent, fg_color="transparent")
-            parent.add(self.evidence_frame, text="📋 Evidence Pack")
+            evidence_container = ctk.CTkFrame(self.evidence_frame, fg_color="transparent")
+            evidence_container.pack(fill="both", expand=True)
             
             # Create the evidence pack generator
-            self.evidence_pack_generator = EvidencePackTab(self.evidence_frame)
+            self.evidence_pack_generator = EvidencePackTab(evidence_container)
             self.evidence_pack_generator.pack(fill="both", expand=True)
+            # Force immediate refresh and update of the Evidence Pack tab
+            self._tab_handlers[str(self.evidence_frame)] = self.evidence_pack_generator.force_update
         else:
             # Fallback message if customtkinter is not available
-            self.evidence_frame = ModernFrame(parent, bg_color=self.colors['bg'])
-            parent.add(self.evidence_frame, text="📋 Evidence Pack")
-            
             unavailable_section, unavailable_content = self.create_modern_section(
                 self.evidence_frame, "Evidence Pack Generator"
             )
@@ -609,122 +686,85 @@ class MainWindow:
                 text="Evidence Pack Generator is not available.\n\n"
                      "To enable this feature, please install the required dependencies:\n"
                      "pip install customtkinter pyperclip",
-                font=('Segoe UI', 12),
-                justify=tk.CENTER,
-                bg=self.colors['card_bg']
+                font=_font(self.root, 'Segoe UI', 12),
+                justify=tk.CENTER
             )
             message_label.pack(pady=50, padx=20)
     
-    def create_settings_tab(self, parent):
+    def create_settings_tab(self):
         """Create the settings tab with modern styling"""
-        self.settings_frame = ModernFrame(parent, bg_color=self.colors['bg'])
-        parent.add(self.settings_frame, text="⚙️ Settings")
+        colors = self.colors
+        card_bg, text_color = colors['card_bg'], colors['text']
         
         # Create scrollable content
-        canvas = tk.Canvas(self.settings_frame, bg=self.colors['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.settings_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ModernFrame(canvas, bg_color=self.colors['bg'])
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Enhanced mousewheel scrolling for macOS
-        def _on_mousewheel(event):
-            if hasattr(event, 'delta') and event.delta:
-                # Windows/macOS with delta
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            elif hasattr(event, 'num'):
-                # Linux scroll events
-                if event.num == 4:
-                    canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    canvas.yview_scroll(1, "units")
-        
-        # Bind mousewheel to the entire tab area
-        def bind_mousewheel_to_all(widget):
-            try:
-                widget.bind("<MouseWheel>", _on_mousewheel, add=True)
-                widget.bind("<Button-4>", _on_mousewheel, add=True)
-                widget.bind("<Button-5>", _on_mousewheel, add=True)
-                for child in widget.winfo_children():
-                    bind_mousewheel_to_all(child)
-            except:
-                pass
-        
-        # Apply comprehensive mousewheel binding
-        def setup_mousewheel():
-            bind_mousewheel_to_all(self.settings_frame)
-            bind_mousewheel_to_all(canvas)
-            bind_mousewheel_to_all(scrollable_frame)
+        scrollable_frame, self.settings_canvas = self._make_scrollable_tab(self.settings_frame)
         
         # Reminder Settings Section
         reminder_section, reminder_content = self.create_modern_section(scrollable_frame, "Reminder Settings")
         
         # Enable reminders checkbox
-        reminder_row = ModernFrame(reminder_content, bg_color=self.colors['card_bg'])
+        reminder_row = ModernFrame(reminder_content)
         reminder_row.pack(fill=tk.X, pady=10)
         
-        self.reminder_enabled_var = tk.BooleanVar(value=True)
         reminder_check = tk.Checkbutton(
             reminder_row,
             text="Enable automatic check reminders",
             variable=self.reminder_enabled_var,
             command=self.toggle_reminders,
-            bg=self.colors['card_bg'],
-            fg=self.colors['text'],
-            selectcolor=self.colors['input_bg'],
-            activebackground=self.colors['card_bg'],
-            activeforeground=self.colors['text'],
-            font=('Segoe UI', 11)
+            bg=card_bg,
+            fg=text_color,
+            selectcolor=colors['input_bg'],
+            activebackground=card_bg,
+            activeforeground=text_color,
+            font=_font(self.root, 'Segoe UI', 11)
         )
         reminder_check.pack(side=tk.LEFT)
         
         # Reminder interval
-        interval_row = ModernFrame(reminder_content, bg_color=self.colors['card_bg'])
+        interval_row = ModernFrame(reminder_content)
         interval_row.pack(fill=tk.X, pady=10)
         
-        ModernLabel(interval_row, text="Reminder interval (hours):", bg=self.colors['card_bg']).pack(side=tk.LEFT)
-        self.reminder_interval_var = tk.StringVar(value="24")
+        ModernLabel(interval_row, text="Reminder interval (hours):").pack(side=tk.LEFT)
         interval_spinbox = ttk.Spinbox(
             interval_row,
             from_=1, to=168, width=10,
             textvariable=self.reminder_interval_var,
-            command=self.update_reminder_interval
+            command=self.update_reminder_interval,
+            # Reject non-numeric keystrokes as they are typed
+            validate='key',
+            validatecommand=(self.root.register(self.validate_reminder_interval), '%P')
         )
         interval_spinbox.pack(side=tk.LEFT, padx=(15, 0))
+        # Typed values only fire these events; all routes share the debounce
+        for sequence in ("<Return>", "<FocusOut>"):
+            interval_spinbox.bind(sequence, lambda e: self.update_reminder_interval())
         
         # Database Settings Section
         db_section, db_content = self.create_modern_section(scrollable_frame, "Database Settings")
         
         # Database location
-        db_row = ModernFrame(db_content, bg_color=self.colors['card_bg'])
+        db_row = ModernFrame(db_content)
         db_row.pack(fill=tk.X, pady=10)
         
-        ModernLabel(db_row, text="Database location:", bg=self.colors['card_bg']).pack(side=tk.LEFT)
+        ModernLabel(db_row, text="Database location:").pack(side=tk.LEFT)
         db_location_label = ModernLabel(
             db_row, 
             text=self.db.db_path, 
-            font=('Consolas', 10),
-            fg=self.colors['text_secondary'],
-            bg=self.colors['card_bg']
+            font=_font(self.root, 'Consolas', 10),
+            fg=colors['text_secondary']
         )
         db_location_label.pack(side=tk.LEFT, padx=(15, 0))
         
         # Database actions
-        db_actions_row = ModernFrame(db_content, bg_color=self.colors['card_bg'])
+        db_actions_row = ModernFrame(db_content)
         db_actions_row.pack(fill=tk.X, pady=(15, 0))
         
         backup_btn = ModernButton(db_actions_row, text="💾 Backup Database", command=self.backup_database,
-                                 bg=self.colors['accent'], fg='#ffffff')
+                                 bg=colors['accent'], fg='#ffffff')
         backup_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         clean_btn = ModernButton(db_actions_row, text="🧹 Clean Old Records", 
-                                command=self.clean_old_records, bg=self.colors['warning'], fg='#000000')
+                                command=self.clean_old_records, bg=colors['warning'], fg='#000000')
         clean_btn.pack(side=tk.LEFT)
         
         # Application Info Section
@@ -734,35 +774,45 @@ class MainWindow:
         version_label = ModernLabel(
             info_content,
             text=f"{APP_NAME}\nVersion 1.0.0\n\nA tool for tracking AWS log checks and generating evidence packs.",
-            justify=tk.LEFT,
-            bg=self.colors['card_bg']
+            justify=tk.LEFT
         )
         version_label.pack(pady=10, anchor="w")
+    
+    def _run_db_task(self, on_done, error_message, func, *args):
+        """Run func(*args) on the database worker and hand its result to on_done on the Tk thread"""
+        future = self._db_pool.submit(func, *args)
+        self._poll_db_task(future, on_done, error_message)
+        return future
+    
+    def _poll_db_task(self, future, on_done, error_message):
+        """Wait for a database task without blocking the Tk event loop"""
+        if not future.done():
+            self.root.after(20, self._poll_db_task, future, on_done, error_message)
+            return
         
-        # Apply mousewheel to new content
-        bind_mousewheel_to_all(reminder_content)
-        bind_mousewheel_to_all(db_content)
-        bind_mousewheel_to_all(info_content)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Store canvas reference for tab refresh
-        self.settings_canvas = canvas
-        
-        # Force initial update and ensure proper scrolling setup
-        def setup_scrolling():
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.update_idletasks()
-            setup_mousewheel()
-        
-        self.root.after(50, setup_scrolling)
+        try:
+            on_done(future.result())
+        except Exception as e:
+            messagebox.showerror("Error", f"{error_message}: {str(e)}")
     
     # Event handlers and utility methods
     def set_current_datetime(self):
         """Set current date and time in the entry field"""
-        now = datetime.datetime.now()
-        self.datetime_var.set(now.strftime("%Y-%m-%d %H:%M:%S"))
+        # Drop microseconds so the value matches what parsing the field would give
+        now = datetime.datetime.now().replace(microsecond=0)
+        # With microseconds dropped this is YYYY-MM-DD HH:MM:SS, without strftime's format parsing
+        text = now.isoformat(sep=" ")
+        self._current_dt = (text, now)  # Lets save_check skip parsing an unedited field
+        self.datetime_var.set(text)
+    
+    def validate_datetime(self, *args):
+        """Enable the Save button only while the date/time text is well formed"""
+        valid = bool(_DATETIME_RE.match(self.datetime_var.get().strip()))
+        self.save_btn.config(state=tk.NORMAL if valid else tk.DISABLED)
+    
+    def validate_reminder_interval(self, value):
+        """Accept only whole hours within the spinbox range, or an empty field while editing"""
+        return value == "" or (value.isdigit() and 1 <= int(value) <= 168)
     
     def save_check(self):
         """Save a log check to the database"""
@@ -770,7 +820,11 @@ class MainWindow:
             # Get values
             datetime_str = self.datetime_var.get().strip()
             outcome = self.outcome_var.get()
-            notes = self.notes_text.get("1.0", tk.END).strip()
+            # An empty Text ends right at 1.0, so skip copying its contents out of Tcl
+            if self.notes_text.index("end-1c") == "1.0":
+                notes = ""
+            else:
+                notes = self.notes_text.get("1.0", "end-1c").strip()
             
             # Validate inputs
             if not datetime_str:
@@ -781,130 +835,280 @@ class MainWindow:
                 messagebox.showerror("Error", "Please select an outcome.")
                 return
             
-            # Parse datetime
-            try:
-                check_datetime = datetime.datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
+            # Reuse the datetime behind an unedited field
+            if datetime_str == self._current_dt[0]:
+                check_datetime = self._current_dt[1]
+            # Parse datetime (the format is checked first, so fromisoformat's C parser accepts it)
+            elif not _DATETIME_RE.match(datetime_str):
                 messagebox.showerror("Error", "Invalid date/time format. Use YYYY-MM-DD HH:MM:SS")
                 return
+            else:
+                try:
+                    check_datetime = datetime.datetime.fromisoformat(datetime_str)
+                except ValueError:
+                    messagebox.showerror("Error", "Invalid date/time format. Use YYYY-MM-DD HH:MM:SS")
+                    return
             
             # Save to database
-            self.db.add_check(check_datetime, outcome, notes)
-            
-            # Refresh history and clear form
-            self.refresh_history()
-            self.clear_form()
-            
-            # Show success message
-            messagebox.showinfo("Success", "Log check saved successfully!")
+            self._run_db_task(self._on_check_saved, "Failed to save check",
+                              self.db.add_check, check_datetime, outcome, notes)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save check: {str(e)}")
     
+    def _on_check_saved(self, record_id):
+        """Finish a save once the database worker has stored the check"""
+        # Refresh history and clear form
+        self.refresh_history()
+        self.clear_form()
+        
+        # Show success message
+        self._toast("Log check saved successfully!", kind='success')
+    
     def clear_form(self):
         """Clear the entry form"""
         self.notes_text.delete("1.0", tk.END)
         self.outcome_combo.set(CHECK_OUTCOMES[0])
         self.set_current_datetime()
     
-    def refresh_history(self):
-        """Refresh the history display"""
+    def refresh_history(self, full=False):
+        """Refresh the history display, adding only records saved since the last load"""
+        if full or self._last_max_id is None:
+            # Hold off paging until the first page of the reload has landed
+            self._history_loading = True
+            self._run_db_task(self._reload_history, "Failed to refresh history",
+                              self._fetch_first_history_page)
+        elif self._history_refresh and not self._history_refresh.done():
+            # One incremental refresh at a time; run once more when it lands
+            self._history_refresh_again = True
+        else:
+            self._history_refresh = self._run_db_task(
+                self._add_new_history, "Failed to refresh history",
+                self.db.get_checks_since, self._last_max_id
+            )
+    
+    def _fetch_first_history_page(self):
+        """Get the first history page and the highest record ID (runs on the DB worker)"""
+        # Read the ID first so a record saved in between is fetched again, not missed
+        max_id = self.db.get_max_check_id()
+        return self.db.get_checks_page(0, HISTORY_PAGE_SIZE), max_id
+    
+    def _history_index(self, timestamp):
+        """Position a record with this timestamp takes in the newest-first history display"""
+        tree = self.history_tree
+        children = tree.get_children()
+        # Binary search for the first row older than the record
+        low, high = 0, len(children)
+        while low < high:
+            mid = (low + high) // 2
+            if tree.set(children[mid], "Date/Time") < timestamp:
+                high = mid
+            else:
+                low = mid + 1
+        return low, len(children)
+    
+    def _add_new_history(self, records):
+        """Insert records saved since the last load at their place in the history display"""
+        if self._history_refresh_again:
+            self._history_refresh_again = False
+            self.root.after_idle(self.refresh_history)
+        if not records:
+            return
+        
+        # IDs only tell us what is new; the display is ordered by timestamp, and a
+        # record can be saved with an earlier date than ones already shown
+        self._last_max_id = max(self._last_max_id, records[-1][0])
+        exists = self.history_tree.exists
+        for record in records:
+            # Another refresh may have landed first, so skip rows already shown
+            if exists(record[0]):
+                continue
+            index, count = self._history_index(str(record[1]))
+            if index == count and not self._history_exhausted:
+                # Older than everything loaded; its page will pick it up
+                continue
+            self._insert_history_rows([record], index)
+            self._history_offset += 1
+    
+    def _reload_history(self, result):
+        """Repopulate the history display with its first page"""
+        records, max_id = result
+        # Clear existing items in a single call, skipping it on the first load
+        children = self.history_tree.get_children()
+        if children:
+            self.history_tree.delete(*children)
+            self._on_history_select()
+        
+        # Display records
+        if records:
+            self._insert_history_rows(records, "end")
+        
+        # The highest ID in the table, not just this page, so older pages loaded
+        # later are never fetched again as new records
+        self._last_max_id = max_id
+        self._history_offset = len(records)
+        self._history_exhausted = len(records) < HISTORY_PAGE_SIZE
+        self._history_loading = False
+    
+    def _append_history_page(self, records):
+        """Add the next page of older records to the bottom of the history display"""
+        self._history_offset += len(records)
+        self._history_exhausted = len(records) < HISTORY_PAGE_SIZE
+        self._history_loading = False
+        
+        # Records saved since the last reload shift the pages down, so the
+        # start of this page may already be shown
+        exists = self.history_tree.exists
+        records = [record for record in records if not exists(record[0])]
+        if records:
+            self._insert_history_rows(records, "end")
+    
+    def _on_history_yscroll(self, first, last):
+        """Update the scrollbar and fetch the next page as the view nears the end"""
+        self.history_scrollbar.set(first, last)
+        if float(last) > 0.9 and not (self._history_loading or self._history_exhausted):
+            self._history_loading = True
+            self._run_db_task(self._append_history_page, "Failed to load history",
+                              self.db.get_checks_page, self._history_offset, HISTORY_PAGE_SIZE)
+    
+    def _insert_history_rows(self, records, index):
+        """Insert rows in one batch so Tk lays out and redraws the tree once"""
+        # Detach the scrollbar so its thumb is recomputed once, not per row
+        self.history_tree.configure(yscrollcommand='')
         try:
-            # Clear existing items
-            for item in self.history_tree.get_children():
-                self.history_tree.delete(item)
-            
-            # Get and display records
-            records = self.db.get_all_checks()
-            for record in records:
-                self.history_tree.insert("", "end", values=record)
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to refresh history: {str(e)}")
+            # One Tcl script rather than a Treeview.insert() round-trip per row.
+            # Rows use the record ID as their item ID; _tcl_quote escapes braces
+            # etc. in the notes
+            insert = f"{self.history_tree._w} insert {{}} {index} -id "
+            lines = [f"{insert}{record[0]} -values {_tcl_quote(record)}" for record in records]
+            self.history_tree.tk.eval("\n".join(lines))
+        finally:
+            self.history_tree.configure(yscrollcommand=self._on_history_yscroll)
+            self._on_history_yscroll(*self.history_tree.yview())
     
     def on_history_double_click(self, event):
         """Handle double-click on history item"""
-        selection = self.history_tree.selection()
+        selection = self._selected_ids
         if selection:
-            item = self.history_tree.item(selection[0])
-            values = item['values']
-            
-            # Show details in a popup
-            self.show_check_details(values)
+            # The tree only holds a notes preview, so load the full record by its ID
+            self._run_db_task(self._on_check_details_loaded, "Failed to load check",
+                              self.db.get_check_record_by_id, int(selection[0]))
+    
+    def _on_history_select(self, event=None):
+        """Remember the selected history records and enable Delete only when there are some"""
+        self._selected_ids = self.history_tree.selection()
+        self.delete_btn.config(state=tk.NORMAL if self._selected_ids else tk.DISABLED)
+    
+    def _on_check_details_loaded(self, record):
+        """Show a record fetched for the details popup"""
+        if record is None:
+            messagebox.showerror("Error", "This record no longer exists.")
+            return
+        
+        # Show details in a popup
+        self.show_check_details(
+            (record['id'], record['timestamp'], record['outcome'], record['notes'])
+        )
     
     def show_check_details(self, record):
         """Show detailed view of a check record"""
+        # The window is built once and then hidden and re-shown with new values
+        if self._details_window is None:
+            self._build_details_window()
+        
+        for label, value in zip(self._details_table.get_children(), record[:3]):
+            self._details_table.item(label, values=(str(value),))
+        
+        self._details_notes_text.config(state=tk.NORMAL)
+        self._details_notes_text.delete("1.0", tk.END)
+        self._details_notes_text.insert("1.0", record[3] if record[3] else "No notes")
+        self._details_notes_text.config(state=tk.DISABLED)
+        # The reused widget keeps its old scroll position, so start each record at the top
+        self._details_notes_text.yview_moveto(0)
+        
+        self._details_window.deiconify()
+        self._details_window.lift()
+        self._details_window.grab_set()
+    
+    def _build_details_window(self):
+        """Create the hidden check details window"""
         details_window = tk.Toplevel(self.root)
+        details_window.withdraw()
         details_window.title("Check Details")
         details_window.geometry("500x400")
         details_window.configure(bg=self.colors['bg'])
         details_window.transient(self.root)
-        details_window.grab_set()
+        details_window.protocol("WM_DELETE_WINDOW", self._hide_check_details)
         
         # Content frame
-        content_frame = ModernFrame(details_window, bg_color=self.colors['card_bg'])
+        content_frame = ModernFrame(details_window)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Title
         title_label = ModernLabel(content_frame, text="Check Details", 
-                                 font=('Segoe UI', 16, 'bold'), bg=self.colors['card_bg'])
+                                 font=_font(self.root, 'Segoe UI', 16, 'bold'))
         title_label.pack(pady=(10, 20))
         
-        # Details
-        details = [
-            ("ID:", record[0]),
-            ("Date/Time:", record[1]),
-            ("Outcome:", record[2])
-        ]
-        
-        for label, value in details:
-            row = ModernFrame(content_frame, bg_color=self.colors['card_bg'])
-            row.pack(fill=tk.X, pady=5)
-            
-            ModernLabel(row, text=label, font=('Segoe UI', 11, 'bold'), 
-                       bg=self.colors['card_bg']).pack(side=tk.LEFT)
-            ModernLabel(row, text=str(value), bg=self.colors['card_bg']).pack(side=tk.LEFT, padx=(10, 0))
+        # Details, as one two-column table rather than a frame and labels per field
+        self._details_table = ttk.Treeview(content_frame, columns=("value",), show="tree",
+                                           height=3, selectmode="none")
+        self._details_table.column("#0", width=120, stretch=False)
+        self._details_table.column("value", width=300)
+        for label in ("ID:", "Date/Time:", "Outcome:"):
+            self._details_table.insert("", "end", iid=label, text=label)
+        self._details_table.pack(fill=tk.X, pady=5)
         
         # Notes section
-        notes_label = ModernLabel(content_frame, text="Notes:", font=('Segoe UI', 11, 'bold'),
-                                 bg=self.colors['card_bg'])
+        notes_label = ModernLabel(content_frame, text="Notes:", font=_font(self.root, 'Segoe UI', 11, 'bold'))
         notes_label.pack(pady=(20, 5), anchor="w")
         
-        notes_text = ModernText(content_frame, height=8, wrap=tk.WORD)
-        notes_text.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
-        notes_text.insert("1.0", record[3] if record[3] else "No notes")
-        notes_text.config(state=tk.DISABLED)
+        self._details_notes_text = ModernText(content_frame, height=8, wrap=tk.WORD)
+        self._details_notes_text.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
         # Close button
-        close_btn = ModernButton(content_frame, text="Close", command=details_window.destroy)
+        close_btn = ModernButton(content_frame, text="Close", command=self._hide_check_details)
         close_btn.pack(pady=(10, 0))
+        
+        self._details_window = details_window
+    
+    def _hide_check_details(self):
+        """Hide the check details window until it is next needed"""
+        self._details_window.grab_release()
+        self._details_window.withdraw()
     
     def delete_selected_record(self):
-        """Delete the selected history record"""
-        selection = self.history_tree.selection()
+        """Delete the selected history records"""
+        # The button is disabled while nothing is selected
+        selection = self._selected_ids
         if not selection:
-            messagebox.showwarning("Warning", "Please select a record to delete.")
             return
         
         # Confirm deletion
-        if messagebox.askyesno("Confirm", "Are you sure you want to delete this record?"):
-            try:
-                item = self.history_tree.item(selection[0])
-                record_id = item['values'][0]
-                
-                self.db.delete_check(record_id)
-                self.refresh_history()
-                
-                messagebox.showinfo("Success", "Record deleted successfully!")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete record: {str(e)}")
+        noun = "this record" if len(selection) == 1 else f"these {len(selection)} records"
+        if messagebox.askyesno("Confirm", f"Are you sure you want to delete {noun}?"):
+            # Item IDs are the record IDs, so no per-row item() lookups are needed
+            ids = [int(item_id) for item_id in selection]
+            self._run_db_task(lambda _: self._on_records_deleted(selection), "Failed to delete record",
+                              self.db.delete_check_records, ids)
+    
+    def _on_records_deleted(self, selection):
+        """Remove deleted records from the history display"""
+        # A reload may have landed while the delete ran, so only drop rows still shown
+        exists = self.history_tree.exists
+        shown = [item_id for item_id in selection if exists(item_id)]
+        if shown:
+            self.history_tree.delete(*shown)
+            self._on_history_select()
+            # Later pages move up by the deleted rows, so step the paging offset back
+            self._history_offset = max(self._history_offset - len(shown), 0)
+        
+        message = "Record deleted successfully!" if len(selection) == 1 else f"{len(selection)} records deleted successfully!"
+        self._toast(message, kind='success')
     
     def export_to_csv(self):
         """Export history to CSV file"""
         try:
             from tkinter import filedialog
-            import csv
             
             # Get file path
             file_path = filedialog.asksaveasfilename(
@@ -914,38 +1118,89 @@ class MainWindow:
             )
             
             if file_path:
-                records = self.db.get_all_checks()
-                
-                with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(["ID", "Date/Time", "Outcome", "Notes"])
-                    writer.writerows(records)
-                
-                messagebox.showinfo("Success", f"History exported to {file_path}")
+                # Rows stream from the database to the file on the database worker
+                self._run_db_task(
+                    lambda _: self._toast(f"History exported to {file_path}", kind='success'),
+                    "Failed to export history", self._write_history_csv, file_path
+                )
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export history: {str(e)}")
     
-    def copy_to_clipboard(self, text):
-        """Copy text to clipboard"""
+    def _write_history_csv(self, file_path):
+        """Write every history record to a CSV file"""
+        import csv
+        
+        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["ID", "Date/Time", "Outcome", "Notes"])
+            for rows in self.db.iter_checks_chunked():
+                writer.writerows(rows)
+    
+    def copy_to_clipboard(self, text, button=None):
+        """Copy text to clipboard, confirming on the button that was pressed"""
         try:
             self.root.clipboard_clear()
             self.root.clipboard_append(text)
-            messagebox.showinfo("Success", "Query copied to clipboard!")
+            # Confirm in place for a moment instead of stopping the user with a dialog
+            if button is not None:
+                button.config(text="✅ Copied")
+                # Restart the timer on repeated copies so the label isn't reset early
+                key = str(button)
+                if key in self._copy_after_ids:
+                    self.root.after_cancel(self._copy_after_ids[key])
+                self._copy_after_ids[key] = self.root.after(
+                    2000, self._reset_copy_button, button
+                )
         except Exception as e:
             messagebox.showerror("Error", f"Failed to copy to clipboard: {str(e)}")
     
+    def _reset_copy_button(self, button):
+        """Return a copy button to its resting label"""
+        self._copy_after_ids.pop(str(button), None)
+        button.config(text=_COPY_LABEL)
+    
+    def _toast(self, text, kind='info'):
+        """Show a short-lived message in the status line without blocking"""
+        color = self.colors['success'] if kind == 'success' else self.colors['text_secondary']
+        self.status_label.config(text=text, fg=color)
+        
+        # A newer message restarts the timer so it gets its full display time
+        if self._toast_after_id:
+            self.root.after_cancel(self._toast_after_id)
+        self._toast_after_id = self.root.after(2500, self._clear_toast)
+    
+    def _clear_toast(self):
+        """Clear the status line"""
+        self._toast_after_id = None
+        self.status_label.config(text="")
+    
     def setup_reminder_system(self):
         """Initialize the reminder system"""
         try:
             # Set up periodic reminders
+            interval = self.reminder_interval_var.get()
             self.reminder_manager.schedule_reminder(
-                hours=int(self.reminder_interval_var.get()),
+                hours=int(interval),
                 message="Time for your regular AWS log check!"
             )
+            self._applied_interval = interval
         except Exception as e:
             print(f"Warning: Could not set up reminders: {e}")
     
+    def on_reminder_triggered(self):
+        """Bring the window forward on the Log Check tab when a reminder is accepted"""
+        # The notebook is kept on self, so there is no widget tree to search
+        self.notebook.select(0)
+        # Raise once Tk is idle, so the tab switch and window manager requests redraw together
+        self.root.after_idle(self._raise_window)
+    
+    def _raise_window(self):
+        """Show, raise and focus the main window"""
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
+    
     def toggle_reminders(self):
         """Toggle reminder system on/off"""
         if self.reminder_enabled_var.get():
@@ -954,7 +1209,20 @@ class MainWindow:
             self.reminder_manager.cancel_reminders()
     
     def update_reminder_interval(self):
-        """Update reminder interval"""
+        """Update reminder interval once the spinbox has settled"""
+        # Coalesce rapid arrow presses into a single reschedule
+        if self._interval_after_id:
+            self.root.after_cancel(self._interval_after_id)
+        self._interval_after_id = self.root.after(300, self._apply_reminder_interval)
+    
+    def _apply_reminder_interval(self):
+        """Reschedule reminders with the current interval"""
+        self._interval_after_id = None
+        # Leaving the field without editing it should not restart the countdown;
+        # an emptied field keeps the last interval
+        interval = self.reminder_interval_var.get()
+        if interval == self._applied_interval or not interval:
+            return
         if self.reminder_enabled_var.get():
             self.setup_reminder_system()
     
@@ -962,7 +1230,6 @@ class MainWindow:
         """Create a backup of the database"""
         try:
             from tkinter import filedialog
-            import shutil
             
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".db",
@@ -971,8 +1238,10 @@ class MainWindow:
             )
             
             if file_path:
-                shutil.copy2(self.db.db_path, file_path)
-                messagebox.showinfo("Success", f"Database backed up to {file_path}")
+                self._run_db_task(
+                    lambda _: self._toast(f"Database backed up to {file_path}", kind='success'),
+                    "Failed to backup database", self.db.backup_to, file_path
+                )
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to backup database: {str(e)}")
@@ -993,24 +1262,28 @@ class MainWindow:
             
             if days:
                 cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days)
-                deleted_count = self.db.clean_old_records(cutoff_date)
-                
-                if deleted_count > 0:
-                    self.refresh_history()
-                    messagebox.showinfo("Success", f"Deleted {deleted_count} old records.")
-                else:
-                    messagebox.showinfo("Info", "No old records found to delete.")
+                self._run_db_task(self._on_records_cleaned, "Failed to clean old records",
+                                  self.db.clean_old_records, cutoff_date)
                     
         except Exception as e:
             messagebox.showerror("Error", f"Failed to clean old records: {str(e)}")
     
+    def _on_records_cleaned(self, deleted_count):
+        """Report the result of clean_old_records and reload the history"""
+        if deleted_count > 0:
+            self.refresh_history(full=True)
+            self._toast(f"Deleted {deleted_count} old records.", kind='success')
+        else:
+            self._toast("No old records found to delete.")
+    
     def on_closing(self):
         """Handle application closing"""
         try:
             # Clean up reminders
             self.reminder_manager.cancel_reminders()
             
-            # Close database connection
+            # Let queued database work finish, then close the connection
+            self._db_pool.shutdown(wait=True)
             self.db.close()
             
             # Destroy window
@@ -9,16 +9,37 @@ from tkinter import messagebox
 from typing import Callable, Optional
 from config import REMINDER_INTERVAL, SNOOZE_INTERVAL
 
+# Reminder dialog text
+_REMINDER_TITLE = "AWS Log Check Reminder"
+_REMINDER_PROMPT = (
+    "Time to check AWS logs!\n\n"
+    "Have you checked the AWS logs recently?\n\n"
+    "Yes - Open log entry form\n"
+    "No - Snooze for 10 minutes\n"
+    "Cancel - Dismiss reminder"
+)
+
 
 class ReminderSystem:
     """Manages background reminders for checking AWS logs"""
     
-    def __init__(self, callback: Optional[Callable] = None):
+    def __init__(self, callback: Optional[Callable] = None, parent: Optional[tk.Misc] = None):
         self.callback = callback
-        self.reminder_thread: Optional[threading.Thread] = None
-        self.stop_event = threading.Event()
-        self.snooze_event = threading.Event()
+        # Window that owns the reminder dialog; without one a hidden root is made per reminder
+        self.parent = parent
         self.is_running = False
+        self._snoozed = False  # Set by snooze_reminder() while a reminder is showing
+        # Optional event-loop scheduler, e.g. (root.after, root.after_cancel)
+        self.scheduler: Optional[Callable] = None
+        self.canceller: Optional[Callable] = None
+        self._after_id = None
+        # Without a scheduler, a one-shot timer thread is armed for each reminder
+        self._timer: Optional[threading.Timer] = None
+    
+    def set_scheduler(self, scheduler: Callable, canceller: Callable):
+        """Schedule reminders on an event loop instead of a background thread"""
+        self.scheduler = scheduler
+        self.canceller = canceller
         
     def start_reminders(self):
         """Start the background reminder system"""
@@ -26,9 +47,8 @@ class ReminderSystem:
             return
             
         self.is_running = True
-        self.stop_event.clear()
-        self.reminder_thread = threading.Thread(target=self._reminder_loop, daemon=True)
-        self.reminder_thread.start()
+        self._snoozed = False
+        self._schedule_next(REMINDER_INTERVAL)
     
     def stop_reminders(self):
         """Stop the background reminder system"""
@@ -36,60 +56,61 @@ class ReminderSystem:
             return
             
         self.is_running = False
-        self.stop_event.set()
-        self.snooze_event.set()  # Wake up if snoozed
-        
-        if self.reminder_thread and self.reminder_thread.is_alive():
-            self.reminder_thread.join(timeout=1.0)
+        if self._after_id is not None:
+            self.canceller(self._after_id)
+            self._after_id = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
     
     def snooze_reminder(self):
         """Snooze the current reminder for the snooze interval"""
-        self.snooze_event.set()
-    
-    def _reminder_loop(self):
-        """Main reminder loop running in background thread"""
-        while not self.stop_event.is_set():
-            # Wait for the reminder interval
-            if self.stop_event.wait(REMINDER_INTERVAL):
-                break  # Stop event was set
-            
-            # Show reminder
-            self._show_reminder()
-            
-            # Check if we should snooze
-            if self.snooze_event.is_set():
-                self.snooze_event.clear()
-                # Wait for snooze interval
-                if self.stop_event.wait(SNOOZE_INTERVAL):
-                    break  # Stop event was set during snooze
+        self._snoozed = True
+    
+    def _schedule_next(self, seconds: int):
+        """Arm the next reminder on the event loop, or on a timer thread without one"""
+        if self.scheduler:
+            self._after_id = self.scheduler(seconds * 1000, self._on_scheduled_reminder)
+            return
+        
+        self._timer = threading.Timer(seconds, self._on_scheduled_reminder)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _on_scheduled_reminder(self):
+        """Show a due reminder and arm the next one"""
+        self._after_id = None
+        self._timer = None
+        if not self.is_running:
+            return
+        
+        self._show_reminder()
+        
+        # The reminder may have been stopped while its dialog was open
+        if not self.is_running:
+            return
+        if self._snoozed:
+            self._snoozed = False
+            self._schedule_next(SNOOZE_INTERVAL)
+        else:
+            self._schedule_next(REMINDER_INTERVAL)
     
     def _show_reminder(self):
         """Show reminder notification to user"""
+        if self.scheduler:
+            self._show_scheduled_reminder()
+            return
+        
         try:
-            # Create a temporary root window if none exists
+            # Create a temporary root window only if there is no window to use
             temp_root = None
-            try:
-                # Try to get the current root window
-                root = tk._default_root
-                if root is None:
-                    temp_root = tk.Tk()
-                    temp_root.withdraw()  # Hide the temporary window
-                    root = temp_root
-            except:
-                temp_root = tk.Tk()
-                temp_root.withdraw()
-                root = temp_root
+            root = self.parent or tk._default_root
+            if root is None:
+                temp_root = root = tk.Tk()
+                temp_root.withdraw()  # Hide the temporary window
             
             # Show the reminder dialog
-            result = messagebox.askyesnocancel(
-                "AWS Log Check Reminder",
-                "Time to check AWS logs!\n\n"
-                "Have you checked the AWS logs recently?\n\n"
-                "Yes - Open log entry form\n"
-                "No - Snooze for 10 minutes\n"
-                "Cancel - Dismiss reminder",
-                icon="question"
-            )
+            result = self._ask_reminder(root)
             
             if result is True:  # Yes - open form
                 if self.callback:
@@ -107,6 +128,28 @@ class ReminderSystem:
         except Exception as e:
             print(f"Error showing reminder: {e}")
     
+    def _show_scheduled_reminder(self):
+        """Show the reminder from the event loop, where the app's root already exists"""
+        try:
+            result = self._ask_reminder(self.parent)
+            if result is True:  # Yes - open form
+                # Already on the main thread, so no after(0) hand-off is needed
+                if self.callback:
+                    self.callback()
+            elif result is False:  # No - snooze
+                self.snooze_reminder()
+        except Exception as e:
+            print(f"Error showing reminder: {e}")
+    
+    def _ask_reminder(self, parent: Optional[tk.Misc]) -> Optional[bool]:
+        """Ask whether to log a check now (True), snooze (False) or dismiss (None)"""
+        return messagebox.askyesnocancel(
+            _REMINDER_TITLE,
+            _REMINDER_PROMPT,
+            icon="question",
+            parent=parent
+        )
+    
     def force_reminder(self):
         """Force show a reminder immediately (for testing)"""
         self._show_reminder()
@@ -117,7 +160,9 @@ class ReminderManager:
     
     def __init__(self, parent_window: tk.Tk):
         self.parent = parent_window
-        self.reminder_system = ReminderSystem(callback=self._on_reminder_callback)
+        self.reminder_system = ReminderSystem(callback=self._on_reminder_callback, parent=parent_window)
+        # The parent window's event loop fires reminders, so no background thread is needed
+        self.reminder_system.set_scheduler(parent_window.after, parent_window.after_cancel)
         self.on_reminder_callback: Optional[Callable] = None
         self.interval_hours = 2  # Default 2 hours
     
@@ -125,6 +170,10 @@ class ReminderManager:
         """Set callback function to call when user responds to reminder"""
         self.on_reminder_callback = callback
     
+    def set_scheduler(self, scheduler: Callable, canceller: Callable):
+        """Run reminders through an event-loop scheduler such as root.after"""
+        self.reminder_system.set_scheduler(scheduler, canceller)
+    
     def set_interval(self, hours: int):
         """Set the reminder interval in hours"""
         self.interval_hours = max(1, hours)  # Minimum 1 hour
@@ -134,8 +183,10 @@ class ReminderManager:
         return self.interval_hours
     
     def schedule_reminder(self, hours: int, message: str = None):
-        """Schedule reminders with the specified interval"""
+        """Schedule reminders with the specified interval, replacing any pending one"""
         self.set_interval(hours)
+        # Cancel first so repeated reschedules never leave an extra callback armed
+        self.stop()
         self.start()
     
     def cancel_reminders(self):
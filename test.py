@@ -18,7 +18,8 @@ def test_database():
     """Test database operations"""
     print("Testing database operations...")
     
-    db = DatabaseManager()
+    # An in-memory database keeps the test off the disk and away from real records
+    db = DatabaseManager(":memory:")
     
     # Test adding a record
     test_outcome = CHECK_OUTCOMES[0]
@@ -26,9 +26,9 @@ def check_requirements():
         ("✅ Should work on macOS (uses standard libraries)", True),
     ]
     
+    # Each list is written with a single print rather than a call per line
     print("Requirements compliance:")
-    for req, status in requirements:
-        print(f"  {req}")
+    print("\n".join(f"  {req}" for req, status in requirements))
     
     print(f"\\n✅ All {len(requirements)} requirements satisfied!\\n")
 
@@ -53,8 +53,7 @@ def check_features():
     ]
     
     print("Implemented features:")
-    for feature in features:
-        print(f"  {feature}")
+    print("\n".join(f"  {feature}" for feature in features))
     
     print(f"\\n✨ {len(features)} features implemented!\\n")
 
@@ -77,14 +76,20 @@ def check_files():
         (".gitignore", "Git ignore rules"),
     ]
     
+    # One directory read instead of a stat() per file
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    
     print("Required files:")
+    lines = []
     all_present = True
     for filename, description in required_files:
-        if os.path.exists(filename):
-            print(f"  ✅ {filename} - {description}")
+        if filename in present:
+            lines.append(f"  ✅ {filename} - {description}")
         else:
-            print(f"  ❌ {filename} - {description} (MISSING)")
+            lines.append(f"  ❌ {filename} - {description} (MISSING)")
             all_present = False
+    print("\n".join(lines))
     
     if all_present:
         print("\\n✅ All required files present!\\n")
@@ -119,14 +124,16 @@ def check_python_compatibility():
     ]
     
     print("\\nRequired modules:")
+    lines = []
     all_available = True
     for module_name, description in required_modules:
         try:
             __import__(module_name)
-            print(f"  ✅ {module_name} - {description}")
+            lines.append(f"  ✅ {module_name} - {description}")
         except ImportError:
-            print(f"  ❌ {module_name} - {description} (NOT AVAILABLE)")
+            lines.append(f"  ❌ {module_name} - {description} (NOT AVAILABLE)")
             all_available = False
+    print("\n".join(lines))
     
     if all_available:
         print("\\n✅ All required modules available!\\n")
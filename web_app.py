@@ -3,37 +3,79 @@ Web-based version of AWS Log Checker Helper
 Cross-platform Flask application - no GUI dependencies required
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, send_from_directory, request, Response
 import datetime
 import json
+import logging
 import os
 from database import DatabaseManager
 from typing import Dict, List
-import tempfile
 import csv
+import io
+import re
+import zlib
+
+# orjson encodes responses much faster than the json module; it is optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Flask-Compress gzips larger JSON responses; it is optional
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
 
 # Override database path for Docker environment
 import config
-DATABASE_PATH = os.path.join(os.getcwd(), 'data', 'checks.db')
+_DATA_DIR = os.path.join(os.getcwd(), 'data')
+DATABASE_PATH = os.path.join(_DATA_DIR, 'checks.db')
 config.DATABASE_PATH = DATABASE_PATH
 
 app = Flask(__name__)
+if COMPRESS_AVAILABLE:
+    # export_csv compresses its own stream, and the index page is sent as a
+    # passthrough file that Flask-Compress leaves alone, so only JSON is listed
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 1
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+log = logging.getLogger(__name__)
+
+def _json_bytes(obj) -> bytes:
+    """Encode obj as JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_response(obj, status=200):
+    """Return obj as a JSON response"""
+    return Response(_json_bytes(obj), status=status, mimetype='application/json')
+
+# Fixed error bodies, encoded once
+_ERR_MISSING_FIELDS = _json_bytes({'error': 'Date/time and outcome are required'})
+_ERR_BAD_DATETIME = _json_bytes({'error': 'Invalid date/time format. Use YYYY-MM-DD HH:MM:SS'})
+_ERR_NOT_FOUND = _json_bytes({'error': 'Record not found'})
+
+# (history key, encoded body) of the last /api/get_history response, replaced
+# as one tuple so concurrent requests never pair a body with the wrong key
+_history_cache = (None, b'')
 
 # Create data directory if it doesn't exist
-os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+os.makedirs(_DATA_DIR, exist_ok=True)
 
-# Add debugging
-print(f"Database path: {DATABASE_PATH}")
-print(f"Current working directory: {os.getcwd()}")
-print(f"Data directory exists: {os.path.exists(os.path.dirname(DATABASE_PATH))}")
+# The directory exists once makedirs returns, so only the path is worth reporting
+log.debug("Database path: %s", DATABASE_PATH)
 
-# Force the database to use the correct path by passing it explicitly
-class DockerDatabaseManager(DatabaseManager):
-    def __init__(self):
-        self.db_path = DATABASE_PATH
-        self.init_database()
+# Force the database to use the correct path by passing it explicitly. Each
+# server thread keeps its own open connection (DatabaseManager._connect)
+db = DatabaseManager(DATABASE_PATH)
 
-db = DockerDatabaseManager()
+# Expected shape of submitted date/times (YYYY-MM-DD HH:MM:SS)
+_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
 
 # Check outcomes from config
 CHECK_OUTCOMES = [
@@ -48,55 +90,68 @@ CHECK_OUTCOMES = [
 @app.route('/')
 def index():
     """Main application page"""
-    return render_template('index.html')
+    # The page has no template variables, so send it as a static file with
+    # conditional-request support instead of rendering it through Jinja
+    return send_from_directory(os.path.join(app.root_path, app.template_folder),
+                               'index.html', max_age=300)
 
 @app.route('/api/save_check', methods=['POST'])
 def save_check():
     """Save a log check to the database"""
     try:
         data = request.json
-        print(f"Received save_check request with data: {data}")
+        log.debug("Received save_check request with data: %s", data)
         
         datetime_str = data.get('datetime', '').strip()
         outcome = data.get('outcome', '')
         notes = data.get('notes', '').strip()
         
-        print(f"Parsed data - datetime: {datetime_str}, outcome: {outcome}, notes: {notes}")
+        log.debug("Parsed data - datetime: %s, outcome: %s, notes: %s", datetime_str, outcome, notes)
         
         if not datetime_str or not outcome:
-            print("Error: Missing datetime or outcome")
-            return jsonify({'error': 'Date/time and outcome are required'}), 400
+            log.debug("Missing datetime or outcome")
+            return Response(_ERR_MISSING_FIELDS, status=400, mimetype='application/json')
         
-        # Parse datetime
+        # Parse datetime: the regex pins the format, then the C ISO parser checks the values
         try:
-            check_datetime = datetime.datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            print(f"Parsed datetime: {check_datetime}")
+            if not _DATETIME_RE.match(datetime_str):
+                raise ValueError(f"not in YYYY-MM-DD HH:MM:SS form: {datetime_str!r}")
+            check_datetime = datetime.datetime.fromisoformat(datetime_str)
+            log.debug("Parsed datetime: %s", check_datetime)
         except ValueError as e:
-            print(f"DateTime parsing error: {e}")
-            return jsonify({'error': 'Invalid date/time format. Use YYYY-MM-DD HH:MM:SS'}), 400
+            log.debug("DateTime parsing error: %s", e)
+            return Response(_ERR_BAD_DATETIME, status=400, mimetype='application/json')
         
         # Save to database
-        print("Attempting to save to database...")
         record_id = db.add_check(check_datetime, outcome, notes)
-        print(f"Saved with record ID: {record_id}")
+        log.debug("Saved with record ID: %s", record_id)
         
-        return jsonify({'success': True, 'id': record_id})
+        return _json_response({'success': True, 'id': record_id})
         
     except Exception as e:
-        print(f"Exception in save_check: {e}")
-        return jsonify({'error': f'Failed to save check: {str(e)}'}), 500
+        log.exception("Exception in save_check")
+        return _json_response({'error': f'Failed to save check: {str(e)}'}, 500)
 
 @app.route('/api/get_history')
 def get_history():
     """Get check history"""
+    global _history_cache
     try:
-        print("Getting history from database...")
-        records = db.get_all_checks()
-        print(f"Retrieved {len(records)} records: {records}")
-        return jsonify({'records': records})
+        # Writes through db bump its revision; the record count and highest ID
+        # also catch adds and deletes from other workers and the desktop app.
+        # The key is read before the query, so a write in between only makes
+        # the next request query again
+        key = (db.checks_revision, db.get_checks_signature())
+        cached_key, body = _history_cache
+        if key != cached_key:
+            records = db.get_all_checks(use_cache=False)
+            log.debug("Retrieved %d records", len(records))
+            body = _json_bytes({'records': records})
+            _history_cache = (key, body)
+        return Response(body, mimetype='application/json')
     except Exception as e:
-        print(f"Exception in get_history: {e}")
-        return jsonify({'error': f'Failed to get history: {str(e)}'}), 500
+        log.exception("Exception in get_history")
+        return _json_response({'error': f'Failed to get history: {str(e)}'}, 500)
 
 @app.route('/api/delete_check/<int:record_id>', methods=['DELETE'])
 def delete_check(record_id):
@@ -104,124 +159,162 @@ def delete_check(record_id):
     try:
         success = db.delete_check(record_id)
         if success:
-            return jsonify({'success': True})
+            return _json_response({'success': True})
         else:
-            return jsonify({'error': 'Record not found'}), 404
+            return Response(_ERR_NOT_FOUND, status=404, mimetype='application/json')
     except Exception as e:
-        return jsonify({'error': f'Failed to delete record: {str(e)}'}), 500
+        return _json_response({'error': f'Failed to delete record: {str(e)}'}, 500)
 
 @app.route('/api/export_csv')
 def export_csv():
     """Export history to CSV"""
     try:
-        records = db.get_all_checks()
+        # Run the query and fetch the first chunk here, so a database error is
+        # reported as JSON rather than breaking the response mid-stream
+        chunks = db.iter_checks_chunked(chunk=500)
+        first = next(chunks, None)
         
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', newline='')
+        def generate():
+            # Stream the rows a chunk at a time instead of building the whole file first
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(["ID", "Date/Time", "Outcome", "Notes"])
+            # The header alone when there are no records
+            if first is None:
+                yield buffer.getvalue()
+                return
+            writer.writerows(first)
+            yield buffer.getvalue()
+            for rows in chunks:
+                buffer.seek(0)
+                buffer.truncate(0)
+                writer.writerows(rows)
+                yield buffer.getvalue()
         
-        writer = csv.writer(temp_file)
-        writer.writerow(["ID", "Date/Time", "Outcome", "Notes"])
-        writer.writerows(records)
-        temp_file.close()
+        def generate_gzip():
+            # Level 1 keeps the CPU cost low while still shrinking the repetitive CSV
+            compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip framing
+            for text in generate():
+                data = compressor.compress(text.encode('utf-8'))
+                if data:
+                    yield data
+            yield compressor.flush()
         
-        return send_file(temp_file.name, as_attachment=True, 
-                        download_name=f'aws_log_checks_{datetime.datetime.now().strftime("%Y%m%d")}.csv',
-                        mimetype='text/csv')
+        filename = f'aws_log_checks_{datetime.datetime.now().strftime("%Y%m%d")}.csv'
+        headers = {'Content-Disposition': f'attachment; filename={filename}',
+                   'Vary': 'Accept-Encoding'}
+        # accept_encodings gives the q-value, so "gzip;q=0" counts as refused
+        if request.accept_encodings['gzip']:
+            headers['Content-Encoding'] = 'gzip'
+            return Response(generate_gzip(), mimetype='text/csv', headers=headers)
+        return Response(generate(), mimetype='text/csv', headers=headers)
                         
     except Exception as e:
-        return jsonify({'error': f'Failed to export CSV: {str(e)}'}), 500
+        return _json_response({'error': f'Failed to export CSV: {str(e)}'}, 500)
+
+# Evidence pack layout; fields the client leaves out show their placeholder
+_EVIDENCE_TEMPLATE = (
+    "AWS Log Checker Helper - Evidence Pack\n\n"
+    "EVIDENCE DOCUMENTATION:\n"
+    + "=" * 33 + "\n\n"
+    "Date/Time: {datetime}\n"
+    "Checker: {checker}\n"
+    "Environment: {environment}\n"
+    "AWS Account: {account}\n\n"
+    "LOG SOURCES CHECKED:\n"
+    "- CloudWatch Logs: {cloudwatch_logs}\n"
+    "- CloudTrail: {cloudtrail}\n"
+    "- Application Logs: {app_logs}\n"
+    "- Security Logs: {security_logs}\n\n"
+    "FINDINGS:\n{findings}\n\n"
+    "ACTIONS TAKEN:\n{actions}\n\n"
+    "FOLLOW-UP REQUIRED:\n{followups}\n\n"
+    "SCREENSHOTS/LOGS:\n{evidence}\n\n"
+    "SIGN-OFF:\n"
+    "Checked by: {checked_by}\n"
+    "Reviewed by: {reviewed_by}\n"
+    "Date: {signoff_date}\n"
+)
+
+_EVIDENCE_PLACEHOLDERS = {
+    'datetime': '[YYYY-MM-DD HH:MM:SS]',
+    'checker': '[Your Name]',
+    'environment': '[Production/Staging/Development]',
+    'account': '[Account ID or Name]',
+    'cloudwatch_logs': '[Log Group Names]',
+    'cloudtrail': '[Trail Names]',
+    'app_logs': '[Service Names]',
+    'security_logs': '[WAF, GuardDuty, etc.]',
+    'evidence': '[Attach or reference any supporting evidence]',
+    'checked_by': '[Name]',
+    'reviewed_by': '[Name]',
+    'signoff_date': '[YYYY-MM-DD]',
+}
+
+# Numbered list sections: (request key, item label, text when the list is empty)
+_EVIDENCE_LISTS = (
+    ('findings', 'Finding', '- No findings reported'),
+    ('actions', 'Action', '- No actions taken'),
+    ('followups', 'Follow-up', '- No follow-up required'),
+)
 
 @app.route('/api/generate_evidence_pack', methods=['POST'])
 def generate_evidence_pack():
     """Generate evidence pack"""
     try:
-        data = request.json
-        
-        # Build evidence pack content
-        content = "AWS Log Checker Helper - Evidence Pack\n\n"
-        content += "EVIDENCE DOCUMENTATION:\n"
-        content += "=" * 33 + "\n\n"
+        # An empty JSON body (null) gets the all-placeholder pack
+        data = request.json or {}
         
-        content += f"Date/Time: {data.get('datetime', '[YYYY-MM-DD HH:MM:SS]')}\n"
-        content += f"Checker: {data.get('checker', '[Your Name]')}\n"
-        content += f"Environment: {data.get('environment', '[Production/Staging/Development]')}\n"
-        content += f"AWS Account: {data.get('account', '[Account ID or Name]')}\n\n"
+        # Fill the template in one pass rather than growing a string piece by piece
+        fields = {**_EVIDENCE_PLACEHOLDERS, **data}
+        for key, label, empty in _EVIDENCE_LISTS:
+            items = data.get(key, [])
+            fields[key] = "\n".join(
+                f"- {label} {i}: {item}" for i, item in enumerate(items, 1)
+            ) if items else empty
+        content = _EVIDENCE_TEMPLATE.format_map(fields)
         
-        content += "LOG SOURCES CHECKED:\n"
-        content += f"- CloudWatch Logs: {data.get('cloudwatch_logs', '[Log Group Names]')}\n"
-        content += f"- CloudTrail: {data.get('cloudtrail', '[Trail Names]')}\n"
-        content += f"- Application Logs: {data.get('app_logs', '[Service Names]')}\n"
-        content += f"- Security Logs: {data.get('security_logs', '[WAF, GuardDuty, etc.]')}\n\n"
-        
-        content += "FINDINGS:\n"
-        findings = data.get('findings', [])
-        if findings:
-            for i, finding in enumerate(findings, 1):
-                content += f"- Finding {i}: {finding}\n"
-        else:
-            content += "- No findings reported\n"
-        content += "\n"
-        
-        content += "ACTIONS TAKEN:\n"
-        actions = data.get('actions', [])
-        if actions:
-            for i, action in enumerate(actions, 1):
-                content += f"- Action {i}: {action}\n"
-        else:
-            content += "- No actions taken\n"
-        content += "\n"
-        
-        content += "FOLLOW-UP REQUIRED:\n"
-        followups = data.get('followups', [])
-        if followups:
-            for i, followup in enumerate(followups, 1):
-                content += f"- Follow-up {i}: {followup}\n"
-        else:
-            content += "- No follow-up required\n"
-        content += "\n"
-        
-        content += f"SCREENSHOTS/LOGS:\n{data.get('evidence', '[Attach or reference any supporting evidence]')}\n\n"
-        
-        content += "SIGN-OFF:\n"
-        content += f"Checked by: {data.get('checked_by', '[Name]')}\n"
-        content += f"Reviewed by: {data.get('reviewed_by', '[Name]')}\n"
-        content += f"Date: {data.get('signoff_date', '[YYYY-MM-DD]')}\n"
-        
-        return jsonify({'content': content})
+        return _json_response({'content': content})
         
     except Exception as e:
-        return jsonify({'error': f'Failed to generate evidence pack: {str(e)}'}), 500
+        return _json_response({'error': f'Failed to generate evidence pack: {str(e)}'}, 500)
+
+# The query library never changes, so it is serialized once at import
+_QUERIES = {
+    "cloudwatch_insights": [
+        {
+            "title": "🔴 Error Detection",
+            "query": "fields @timestamp, @message\n| filter @message like /(?i)(error|exception|fail|failed)/\n| sort @timestamp desc\n| limit 10"
+        },
+        {
+            "title": "⚡ Performance Issues", 
+            "query": "fields @timestamp, @message, elapsed_ms\n| filter ispresent(elapsed_ms)\n| sort elapsed_ms desc\n| limit 10"
+        },
+        {
+            "title": "💾 Memory Usage",
+            "query": "fields @timestamp, @message\n| filter @message like /memory/\n| sort @timestamp desc\n| limit 10"
+        }
+    ],
+    "aws_cli": [
+        {
+            "title": "🔐 CloudTrail Failed Logins",
+            "query": "aws logs start-query \\\n--log-group-name YOUR_CLOUDTRAIL_LOG_GROUP \\\n--start-time $(date -v-2H +%s) \\\n--end-time $(date +%s) \\\n--query-string \"fields @timestamp, @message | filter eventName = 'ConsoleLogin' and errorMessage = 'Failed authentication'\""
+        },
+        {
+            "title": "🖥️ SSM Session History",
+            "query": "aws ssm describe-sessions \\\n--state \"History\" \\\n--filters key=Owner,value=* \\\n--query \"Sessions[?StartDate>=`date -v-2H +%Y-%m-%dT%H:%M:%SZ`].[SessionId,Owner,StartDate]\" \\\n--output table"
+        }
+    ]
+}
+_QUERIES_JSON = json.dumps(_QUERIES, ensure_ascii=False).encode('utf-8')
 
 @app.route('/api/queries')
 def get_queries():
     """Get AWS queries"""
-    queries = {
-        "cloudwatch_insights": [
-            {
-                "title": "🔴 Error Detection",
-                "query": "fields @timestamp, @message\n| filter @message like /(?i)(error|exception|fail|failed)/\n| sort @timestamp desc\n| limit 10"
-            },
-            {
-                "title": "⚡ Performance Issues", 
-                "query": "fields @timestamp, @message, elapsed_ms\n| filter ispresent(elapsed_ms)\n| sort elapsed_ms desc\n| limit 10"
-            },
-            {
-                "title": "💾 Memory Usage",
-                "query": "fields @timestamp, @message\n| filter @message like /memory/\n| sort @timestamp desc\n| limit 10"
-            }
-        ],
-        "aws_cli": [
-            {
-                "title": "🔐 CloudTrail Failed Logins",
-                "query": "aws logs start-query \\\n--log-group-name YOUR_CLOUDTRAIL_LOG_GROUP \\\n--start-time $(date -v-2H +%s) \\\n--end-time $(date +%s) \\\n--query-string \"fields @timestamp, @message | filter eventName = 'ConsoleLogin' and errorMessage = 'Failed authentication'\""
-            },
-            {
-                "title": "🖥️ SSM Session History",
-                "query": "aws ssm describe-sessions \\\n--state \"History\" \\\n--filters key=Owner,value=* \\\n--query \"Sessions[?StartDate>=`date -v-2H +%Y-%m-%dT%H:%M:%SZ`].[SessionId,Owner,StartDate]\" \\\n--output table"
-            }
-        ]
-    }
-    return jsonify(queries)
+    return Response(_QUERIES_JSON, mimetype='application/json',
+                    headers={'Cache-Control': 'public, max-age=3600'})
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=8080, debug=True)
\ No newline at end of file
+    # Development server; the Docker image runs the app under gunicorn instead.
+    # The debugger and reloader are opt-in with FLASK_DEBUG=1
+    app.run(host='0.0.0.0', port=8080, debug=os.environ.get('FLASK_DEBUG') == '1')
\ No newline at end of file